@@ -1,60 +1,69 @@
 import sys
+import importlib
 from pathlib import Path
-from shiny import ui, App, reactive
+from shiny import ui, reactive
 import os
 import uvicorn
-
-from starlette.applications import Starlette
-from starlette.routing import Mount, Route
-from starlette.responses import RedirectResponse
-from starlette.middleware.sessions import SessionMiddleware
 sys.dont_write_bytecode = True
 
-# from custom_ui.details_tabs import details
-from custom_ui.tab_00_start import start
-from custom_ui.tab_04_results import results
-from custom_ui.tab_01_location import location
-from custom_ui.tab_02_climate import climate
-from custom_ui.tab_03_species import main_species
-from custom_ui.tab_05_admin import admin
-from custom_ui.tab_06_recommend import recommend
-from custom_ui.i18n import lang_toggle, lang_init_script
-
-from custom_server.server_app import server_app
-from custom_server.server_admin import server_admin
-from custom_server.server_homepage import server_homepage
-from custom_server.server_recommend import server_recommend
-css_file = os.path.join(Path(__file__).parent, "data", "ui.css")
+from custom_app import create_app
+# Read the stylesheet once at import and inline it, instead of serving it as a
+# separate dependency file
+with open(Path(__file__).parent / "data" / "ui.css", "rb") as f:
+    _CSS = f.read().decode("utf-8")
 
 
 # TODO: mount each tab like litefarm dashboard.
 
-app_ui = ui.page_fluid(
-    ui.include_css(css_file),
-    lang_init_script(),
-    ui.page_navbar(
-        start,
-        location,
-        climate,
-        main_species,
-        # details,
-        results,
-        recommend,
-        admin,
-        ui.nav_spacer(),
-        ui.nav_control(ui.output_ui("location_badge")),
-        ui.nav_control(lang_toggle()),
-        title=ui.span(
-            "\U0001F334",
-            style="font-size: 1.6rem; line-height: 1;",
-        ),
-        id="main_nav",
-    ),
+# Tab modules in navbar order; each exposes a custom_ui.tab.Tab as TAB
+TABS = (
+    "custom_ui.tab_00_start",
+    "custom_ui.tab_01_location",
+    "custom_ui.tab_02_climate",
+    "custom_ui.tab_03_species",
+    # "custom_ui.details_tabs",
+    "custom_ui.tab_04_results",
+    "custom_ui.tab_06_recommend",
+    "custom_ui.tab_05_admin",
+)
+
+# Server modules used by combined_server, imported in parallel at startup
+SERVERS = (
+    "custom_server.server_app",
+    "custom_server.server_admin",
+    "custom_server.server_recommend",
 )
 
 
+def build_ui():
+    """Assemble the page. Tab modules are imported here, on first use."""
+    from custom_ui.i18n import lang_toggle, lang_init_script
+
+    tabs = tuple(importlib.import_module(module).TAB for module in TABS)
+
+    return ui.page_fluid(
+        ui.tags.style(_CSS),
+        lang_init_script(),
+        ui.page_navbar(
+            *(tab.nav_panel for tab in tabs),
+            ui.nav_spacer(),
+            ui.nav_control(ui.output_ui("location_badge")),
+            ui.nav_control(lang_toggle()),
+            title=ui.span(
+                "\U0001F334",
+                style="font-size: 1.6rem; line-height: 1;",
+            ),
+            id="main_nav",
+        ),
+    )
+
+
 def combined_server(input, output, session):
     """Combined server function that includes all server logic."""
+    from custom_server.server_app import server_app
+    from custom_server.server_admin import server_admin
+    from custom_server.server_recommend import server_recommend
+
     server_app(input, output, session)
     server_admin(input, output, session)
     server_recommend(input, output, session)
@@ -65,22 +74,20 @@ def combined_server(input, output, session):
     def _navigate():
         ui.update_navs("main_nav", selected=input._nav_to())
 
-static_dir = Path(__file__).parent / "data"
-shiny_app = App(app_ui, combined_server, static_assets=static_dir)
 
-# Redirect root to your shiny app
-async def redirect_handler(request):
-    return RedirectResponse(url="/diversiplant")
-
-# Set up routes
-routes = [
-    Route("/", endpoint=redirect_handler),
-    Mount("/diversiplant", app=shiny_app)
-]
+static_dir = Path(__file__).parent / "data"
+app = create_app(
+    build_ui, combined_server, mount="/diversiplant", static_dir=static_dir, preload=SERVERS
+)
 
-# Create the Starlette app
-app = Starlette(routes=routes)
-app.add_middleware(SessionMiddleware, secret_key="feur")
+# Worker count: WEB_CONCURRENCY if set, else 2*CPU+1 capped at 9
+# (every worker re-imports shiny/pandas/geopandas, so memory grows per worker)
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", min(2 * (os.cpu_count() or 1) + 1, 9)))
 
 if __name__ == "__main__":
-    uvicorn.run("app:app", host='0.0.0.0', port=8001, workers=4, ws_ping_interval = 48000, ws_ping_timeout= None)
+    # C event loop and HTTP parser (uvloop has no Windows build)
+    uvicorn.run(
+        "app:app", host='0.0.0.0', port=8001, workers=WEB_CONCURRENCY,
+        loop="asyncio" if sys.platform == "win32" else "uvloop", http="httptools", ws="websockets",
+        ws_ping_interval=48000, ws_ping_timeout=None,
+    )
@@ -1,42 +1,194 @@
 """DiversiPlant Data Crawlers Module."""
-from typing import Optional
-from .base import BaseCrawler
-from .gbif import GBIFCrawler
-from .reflora import REFLORACrawler
-from .gift import GIFTCrawler
-from .wcvp import WCVPCrawler
-from .worldclim import WorldClimCrawler
-from .treegoer import TreeGOERCrawler
-from .iucn import IUCNCrawler
-from .try_db import TRYCrawler
-from .practitioners import PractitionersCrawler
-from .gbif_occurrences import GBIFOccurrenceCrawler
-
-CRAWLERS = {
-    'gbif': GBIFCrawler,
-    'gbif_occurrences': GBIFOccurrenceCrawler,
-    'reflora': REFLORACrawler,
-    'gift': GIFTCrawler,
-    'wcvp': WCVPCrawler,
-    'worldclim': WorldClimCrawler,
-    'treegoer': TreeGOERCrawler,
-    'iucn': IUCNCrawler,
-    'try': TRYCrawler,
-    'practitioners': PractitionersCrawler,
-}
-
-
-def get_crawler(name: str, db_url: str) -> Optional[BaseCrawler]:
-    """Get a crawler instance by name."""
-    crawler_class = CRAWLERS.get(name.lower())
-    if crawler_class:
-        return crawler_class(db_url)
-    return None
-
-
-def list_crawlers() -> list:
+import asyncio
+import importlib
+import importlib.util
+import logging
+import sys
+import threading
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Optional
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from .base import ENGINE_OPTIONS, BaseCrawler, create_http_session
+
+logger = logging.getLogger('crawler.registry')
+
+# (registry name, module, class). Crawler modules pull in pandas, numpy,
+# rasterio etc., so they are only imported when a crawler is first used.
+_CRAWLER_SPEC = (
+    ('gbif', '.gbif', 'GBIFCrawler'),
+    ('gbif_occurrences', '.gbif_occurrences', 'GBIFOccurrenceCrawler'),
+    ('reflora', '.reflora', 'REFLORACrawler'),
+    ('gift', '.gift', 'GIFTCrawler'),
+    ('wcvp', '.wcvp', 'WCVPCrawler'),
+    ('worldclim', '.worldclim', 'WorldClimCrawler'),
+    ('treegoer', '.treegoer', 'TreeGOERCrawler'),
+    ('iucn', '.iucn', 'IUCNCrawler'),
+    ('try', '.try_db', 'TRYCrawler'),
+    ('practitioners', '.practitioners', 'PractitionersCrawler'),
+)
+
+
+def _validate_spec():
+    """Fail at import if a registered module is missing, without importing it."""
+    for name, module, _ in _CRAWLER_SPEC:
+        if importlib.util.find_spec(module, __name__) is None:
+            raise ImportError(f"Crawler '{name}': module {module} not found in {__name__}")
+
+
+_validate_spec()
+
+
+@lru_cache(maxsize=None)
+def _resolve(module: str, cls: str) -> type:
+    """Import a crawler module and return its crawler class."""
+    return getattr(importlib.import_module(module, __name__), cls)
+
+
+# Read-only registry keyed by interned lowercase names; each value resolves
+# the crawler class on call
+CRAWLERS = MappingProxyType({
+    sys.intern(name): partial(_resolve, module, cls)
+    for name, module, cls in _CRAWLER_SPEC
+})
+_CRAWLER_NAMES = tuple(CRAWLERS)
+_CLASS_MODULES = {cls: module for _, module, cls in _CRAWLER_SPEC}
+
+
+def __getattr__(attr: str):
+    """Resolve crawler classes (e.g. crawlers.GBIFCrawler) on first access."""
+    if attr in _CLASS_MODULES:
+        return _resolve(_CLASS_MODULES[attr], attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
+# HTTP session and engines shared by every crawler built through get_crawler
+_SHARED_SESSION: Optional[requests.Session] = None
+_ENGINES: Dict[str, Engine] = {}
+# run_all builds crawlers from several threads at once; without this two
+# of them could each create (and one then leak) a pool for the same URL
+_SHARED_LOCK = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide pooled HTTP session, creating it on first use."""
+    global _SHARED_SESSION
+    with _SHARED_LOCK:
+        if _SHARED_SESSION is None:
+            _SHARED_SESSION = create_http_session()
+        return _SHARED_SESSION
+
+
+def get_engine(db_url: str) -> Engine:
+    """Get the pooled engine for a database URL, creating it on first use."""
+    with _SHARED_LOCK:
+        engine = _ENGINES.get(db_url)
+        if engine is None:
+            # Creating an engine does not connect, so holding the lock is cheap
+            engine = create_engine(db_url, **ENGINE_OPTIONS)
+            _ENGINES[db_url] = engine
+        return engine
+
+
+def _build_crawler(crawler_class, db_url: str,
+                   session: Optional[requests.Session] = None,
+                   engine: Optional[Engine] = None) -> BaseCrawler:
+    """Instantiate a crawler with the shared HTTP session and engine."""
+    return crawler_class(
+        db_url,
+        session=session or get_http_session(),
+        engine=engine or get_engine(db_url)
+    )
+
+
+@lru_cache(maxsize=64)
+def _make(name: str, db_url: str) -> BaseCrawler:
+    """Cached constructor for crawlers that are safe to reuse across runs."""
+    return _build_crawler(CRAWLERS[name](), db_url)
+
+
+def get_crawler(name: str, db_url: str,
+                session: Optional[requests.Session] = None,
+                engine: Optional[Engine] = None) -> Optional[BaseCrawler]:
+    """
+    Get a crawler instance by name.
+
+    Crawlers marked _SINGLETON_SAFE are built once per (name, db_url) and
+    reused; the others, and calls passing an explicit session or engine,
+    get a fresh instance.
+    """
+    # Callers usually pass lowercase names already; only lower() on a miss
+    if name not in CRAWLERS:
+        name = name.lower()
+    resolver = CRAWLERS.get(name)
+    if resolver is None:
+        return None
+    crawler_class = resolver()
+    if crawler_class._SINGLETON_SAFE and session is None and engine is None:
+        return _make(name, db_url)
+    return _build_crawler(crawler_class, db_url, session, engine)
+
+
+get_crawler.cache_clear = _make.cache_clear
+
+
+def list_crawlers() -> tuple:
     """List all available crawler names."""
-    return list(CRAWLERS.keys())
+    return _CRAWLER_NAMES
+
+
+def _run_crawler(name: str, mode: str, db_url: str, **kwargs) -> bool:
+    """Default runner for run_all: build the crawler and run it."""
+    crawler = get_crawler(name, db_url)
+    if crawler is None:
+        raise ValueError(f"Unknown crawler: {name}")
+    crawler.run(mode=mode, **kwargs)
+    return True
+
+
+async def run_all(names: Iterable[str], db_url: str, mode: str = 'incremental',
+                  max_batch: int = 4, runner: Optional[Callable[..., bool]] = None,
+                  **kwargs) -> Dict[str, bool]:
+    """
+    Run several crawlers, up to max_batch of them at a time.
+
+    Each batch runs in worker threads via asyncio.gather, sharing the pooled
+    HTTP session and engine. A failing crawler is recorded as False and does
+    not stop the rest of its batch.
+
+    Args:
+        names: Crawler names to run
+        db_url: PostgreSQL connection string
+        mode: 'full' or 'incremental'
+        max_batch: Maximum number of crawlers running concurrently
+        runner: Callable (name, mode, db_url, **kwargs) -> bool; defaults to
+            building the crawler with get_crawler and calling run()
+        **kwargs: Passed through to the runner
+
+    Returns:
+        Dict mapping crawler name to success
+    """
+    runner = runner or _run_crawler
+    names = list(names)
+    step = max(max_batch, 1)
+    results: Dict[str, bool] = {}
+
+    for i in range(0, len(names), step):
+        batch = names[i:i + step]
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(runner, name, mode, db_url, **kwargs) for name in batch),
+            return_exceptions=True
+        )
+        for name, outcome in zip(batch, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Crawler {name} failed: {outcome}")
+                results[name] = False
+            else:
+                results[name] = bool(outcome)
+
+    return results
 
 
 __all__ = [
@@ -52,5 +204,8 @@ __all__ = [
     'TRYCrawler',
     'PractitionersCrawler',
     'get_crawler',
+    'get_engine',
+    'get_http_session',
     'list_crawlers',
+    'run_all',
 ]
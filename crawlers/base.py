@@ -1,31 +1,238 @@
 """Base crawler class for DiversiPlant data sources."""
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Generator, Dict, Any, Optional
+from typing import Generator, Dict, Any, Optional, Union
+import csv
+import io
 import logging
-from sqlalchemy import create_engine, text
+import queue
+import threading
+import warnings
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Parent of the per-crawler "crawler.<name>" loggers. Handlers and levels are
+# left to the entry point (crawlers/run.py, crawlers/scheduler.py).
+logger = logging.getLogger('crawler')
+
+
+# Connection pool settings for crawler engines. Parallel runs share one
+# engine per database URL (see crawlers.get_engine).
+ENGINE_OPTIONS = {
+    'pool_size': 20,
+    'max_overflow': 30,
+    'pool_pre_ping': True,   # drop connections the server closed while idle
+    'pool_recycle': 1800,
+    'pool_timeout': 30,
+    # psycopg2 otherwise runs executemany of text() statements one round
+    # trip per row; execute_batch sends up to a whole batch per round trip
+    'executemany_mode': 'values_plus_batch',
+    'executemany_batch_page_size': 1000,
+}
+
+
+# Transient gateway errors are retried with backoff inside the adapter.
+# 429 is left to the crawlers, which honour Retry-After themselves, and the
+# last response is returned rather than raised so raise_for_status and 404
+# checks keep working.
+HTTP_RETRY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
 )
 
 
+def create_http_session(pool_connections: int = 8, pool_maxsize: int = 64) -> requests.Session:
+    """Create a requests Session with a bounded keep-alive connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=HTTP_RETRY)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class BaseCrawler(ABC):
-    """Abstract base class for all data crawlers."""
+    """
+    Abstract base class for all data crawlers.
+
+    Crawlers log to "crawler.<name>" but do not configure logging; callers
+    set up handlers (e.g. logging.basicConfig) before running them.
+    """
+
+    # Whether get_crawler may cache and reuse one instance across runs.
+    # Crawlers that keep downloaded source data on the instance set this to
+    # False so each run starts from fresh data.
+    _SINGLETON_SAFE = True
+
+    # Records written per transaction by _flush
+    batch_size = 1000
+
+    # Threads running transform/validate during run(); 1 runs everything on
+    # the calling thread
+    max_workers = 20
+
+    # Items handed to a worker thread at a time by the pipelined run()
+    transform_chunk_size = 100
+
+    # species columns written by _upsert_species_batch besides the source ID
+    SPECIES_COLUMNS = ('genus', 'family', 'taxonomic_status')
+
+    # species_traits columns written by _save_traits
+    TRAIT_COLUMNS = (
+        'growth_form', 'max_height_m', 'stratum', 'life_form', 'woodiness',
+        'nitrogen_fixer', 'dispersal_syndrome', 'deciduousness',
+        '_gift_trait_1_2_2', '_gift_trait_1_4_2',
+    )
+
+    # NULLs never overwrite values already stored for this source
+    # (needs migration 013 for the unique constraint)
+    _TRAITS_UPSERT = text(f"""
+        INSERT INTO species_traits (species_id, source, {', '.join(TRAIT_COLUMNS)})
+        VALUES (:species_id, :source, {', '.join(f':{c}' for c in TRAIT_COLUMNS)})
+        ON CONFLICT (species_id, source) DO UPDATE SET
+            {', '.join(f"{c} = COALESCE(EXCLUDED.{c}, species_traits.{c})" for c in TRAIT_COLUMNS)}
+    """)
+
+    _COMMON_NAME_INSERT = text("""
+        INSERT INTO common_names (species_id, common_name, language, source)
+        VALUES (:sid, :name, :lang, :src)
+        ON CONFLICT (species_id, common_name, language) DO NOTHING
+    """)
+    # Full refreshes COPY names into common_names_staging first
+    _COMMON_NAME_COLUMNS = ('species_id', 'common_name', 'language', 'source')
+    _COMMON_NAME_MERGE = text("""
+        INSERT INTO common_names (species_id, common_name, language, source)
+        SELECT species_id, common_name, language, source FROM common_names_staging
+        ON CONFLICT (species_id, common_name, language) DO NOTHING
+    """)
+
+    _BRAZIL_DISTRIBUTION_UPSERT = text("""
+        INSERT INTO species_distribution_brazil
+            (species_id, state_code, establishment, is_endemic, phytogeographic_domain, source)
+        VALUES (:sid, :state, :estab, :endemic, :domains, :src)
+        ON CONFLICT (species_id, state_code) DO UPDATE SET
+            establishment = EXCLUDED.establishment,
+            is_endemic = EXCLUDED.is_endemic,
+            phytogeographic_domain = EXCLUDED.phytogeographic_domain
+    """)
+
+    # details is bound as JSONB, so callers pass the dict itself
+    _LOG_INSERT = text("""
+        INSERT INTO crawler_logs (crawler_name, level, message, details)
+        VALUES (:name, :level, :msg, :details)
+    """).bindparams(bindparam('details', type_=JSONB(none_as_null=True)))
+
+    # crawler_status and crawler_runs are updated together by one statement each
+    _RUN_STARTED = text("""
+        WITH status AS (
+            UPDATE crawler_status
+            SET status = 'running', last_run = NOW()
+            WHERE crawler_name = :name
+        )
+        INSERT INTO crawler_runs (crawler_name, started_at, status)
+        VALUES (:name, NOW(), 'running')
+        RETURNING id
+    """)
+
+    _RUN_COMPLETED = text("""
+        WITH status AS (
+            UPDATE crawler_status
+            SET status = 'completed',
+                last_success = NOW(),
+                records_processed = :processed
+            WHERE crawler_name = :name
+        )
+        UPDATE crawler_runs
+        SET completed_at = NOW(),
+            status = 'completed',
+            records_processed = :processed,
+            records_inserted = :inserted,
+            records_updated = :updated
+        WHERE id = :id
+    """)
+
+    _RUN_FAILED = text("""
+        WITH status AS (
+            UPDATE crawler_status
+            SET status = 'failed',
+                error_count = error_count + 1
+            WHERE crawler_name = :name
+        )
+        UPDATE crawler_runs
+        SET completed_at = NOW(),
+            status = 'failed',
+            error_message = :msg
+        WHERE id = :id
+    """)
+
+    # crawler_logs rows buffered before they are written in one executemany
+    LOG_FLUSH_SIZE = 100
+
+    # Applied to each batch transaction of a full refresh; work_mem covers the
+    # staging merges (see _begin_batch)
+    _FULL_REFRESH_SETTINGS = (
+        text("SET LOCAL synchronous_commit = off"),
+        text("SET LOCAL work_mem = '256MB'"),
+    )
+
+    # Trait sources in species_unified priority order: gift > reflora > wcvp > treegoer.
+    # GIFT is prioritized for using more consistent definitions (liana vs vine)
+    # and following Renata's Climber.R logic (trait_1.2.2 + trait_1.4.2)
+    SOURCE_PRIORITY = ('gift', 'reflora', 'wcvp', 'treegoer')
+
+    # Column holding each source's own ID for a species
+    _SOURCE_ID_MAP = {
+        'gbif': 'gbif_taxon_key',
+        'reflora': 'reflora_id',
+        'gift': 'gift_work_id',
+        'wcvp': 'wcvp_id',
+        'iucn': 'iucn_taxon_id',
+    }
+
+    # Removed hooks that subclasses may still define; nothing calls them
+    _REMOVED_METHODS = ('_insert_species', '_update_species', '_upsert_species')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for method in cls._REMOVED_METHODS:
+            if method in vars(cls):
+                warnings.warn(
+                    f"{cls.__name__}.{method} is never called; "
+                    "species are saved through _save_batch",
+                    DeprecationWarning,
+                    stacklevel=2
+                )
 
-    def __init__(self, db_url: str):
+    def __init__(self, db_url: str, session: Optional[requests.Session] = None,
+                 engine: Optional[Engine] = None):
         """
         Initialize the crawler.
 
         Args:
             db_url: PostgreSQL connection string
+            session: Shared HTTP session; a pooled one is created if omitted
+            engine: Shared SQLAlchemy engine; one is created from db_url if omitted
         """
-        self.engine = create_engine(db_url)
-        self.Session = sessionmaker(bind=self.engine)
-        self.logger = logging.getLogger(f"crawler.{self.name}")
+        self.engine = engine if engine is not None else create_engine(db_url, **ENGINE_OPTIONS)
+        self.session = session or create_http_session()
+        # Only raw SQL runs through sessions, so nothing needs expiring on commit
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.logger = logger.getChild(self.name)
+        self._id_field = self._SOURCE_ID_MAP.get(self.name)
+        # Hooks left at their defaults are skipped in _transform_item
+        self._custom_validate = type(self).validate is not BaseCrawler.validate
+        self._custom_pre_validate = type(self).pre_validate is not BaseCrawler.pre_validate
+        self._species_columns = (*self.SPECIES_COLUMNS, *([self._id_field] if self._id_field else []))
+        # UPSERT statements keyed by VALUES row count; 0 selects from species_staging
+        self._upsert_templates: Dict[int, Any] = {}
         self.stats = {
             'processed': 0,
             'inserted': 0,
@@ -34,6 +241,11 @@ class BaseCrawler(ABC):
             'skipped': 0
         }
         self._run_id: Optional[int] = None
+        self._buffer: list = []
+        self._log_conn: Optional[Connection] = None
+        self._pending_logs: list = []
+        # Full refreshes load species and common names through COPY (see _copy_rows)
+        self._use_copy = False
 
     @property
     @abstractmethod
@@ -47,7 +259,7 @@ class BaseCrawler(ABC):
         Fetch data from the external source.
 
         Yields:
-            Dict containing raw data from the source
+            Dict containing raw data for one item (use yield from for pages)
         """
         pass
 
@@ -64,10 +276,28 @@ class BaseCrawler(ABC):
         """
         pass
 
+    def pre_validate(self, raw_data: Dict) -> bool:
+        """
+        Optionally reject raw data before transform runs.
+
+        Override to skip transform for items that can never be saved.
+
+        Args:
+            raw_data: Raw data from the source
+
+        Returns:
+            True if the item should be transformed, False to skip it
+        """
+        return True
+
     def validate(self, data: Dict) -> bool:
         """
         Validate transformed data before insertion.
 
+        Only called when overridden; the default check (a non-empty
+        canonical_name) is inlined in _transform_item. Overrides replace
+        that check entirely.
+
         Args:
             data: Transformed data
 
@@ -86,21 +316,18 @@ class BaseCrawler(ABC):
             **kwargs: Additional arguments passed to fetch_data
         """
         self.logger.info(f"Starting {self.name} crawler in {mode} mode")
+        self._reset_stats()
+        self._use_copy = mode == 'full'
         self._log_start()
 
         try:
-            for batch in self.fetch_data(mode=mode, **kwargs):
-                try:
-                    if isinstance(batch, list):
-                        for item in batch:
-                            self._process_item(item)
-                    else:
-                        self._process_item(batch)
-                except Exception as e:
-                    self.stats['errors'] += 1
-                    self.logger.error(f"Error processing batch: {e}")
-                    self._log_message('ERROR', str(e))
+            if self.max_workers > 1:
+                self._run_pipelined(mode, **kwargs)
+            else:
+                for item in self.fetch_data(mode=mode, **kwargs):
+                    self._process_item(item)
 
+            self._flush()
             self._log_success()
             self.logger.info(f"Completed {self.name}: {self.stats}")
 
@@ -109,400 +336,507 @@ class BaseCrawler(ABC):
             self._log_error(str(e))
             raise
 
-    def _process_item(self, raw_data: Dict):
-        """Process a single data item."""
+    def _reset_stats(self):
+        """Zero the counters so a reused instance reports per-run stats."""
+        self.stats = {key: 0 for key in self.stats}
+        self._run_id = None
+        self._buffer = []
+
+    def _run_pipelined(self, mode: str, **kwargs):
+        """
+        Run fetch, transform and save concurrently.
+
+        fetch_data runs on a producer thread and transform/validate on a pool
+        of max_workers threads; this thread saves results in fetch order, so
+        all database writes stay on one thread.
+
+        Items are submitted in chunks of transform_chunk_size, so the pool
+        and queue are touched once per chunk rather than once per item. The
+        queue holds at least a batch of items, so fetching the next batch
+        overlaps with writing the current one and memory stays bounded.
+        """
+        chunk_size = self.transform_chunk_size
+        pending = queue.Queue(maxsize=max(self.max_workers * 2, -(-self.batch_size // chunk_size)))
+        done = object()
+
+        # Set when the consumer stops early, so the producer does not block
+        # forever on a full queue holding the fetch_data generator open
+        stop = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            def put(entry) -> bool:
+                while not stop.is_set():
+                    try:
+                        pending.put(entry, timeout=0.1)
+                        return True
+                    except queue.Full:
+                        pass
+                return False
+
+            def produce():
+                items = None
+                try:
+                    items = self.fetch_data(mode=mode, **kwargs)
+                    chunk = []
+                    for item in items:
+                        chunk.append(item)
+                        if len(chunk) >= chunk_size:
+                            if not put(pool.submit(self._transform_chunk, chunk)):
+                                return
+                            chunk = []
+                    if chunk and not put(pool.submit(self._transform_chunk, chunk)):
+                        return
+                    put(done)
+                except BaseException as e:
+                    put(e)
+                finally:
+                    # Release fetch_data's connections now, not at garbage collection
+                    close = getattr(items, 'close', None)
+                    if close is not None:
+                        close()
+
+            producer = threading.Thread(target=produce, name=f"{self.name}-fetch", daemon=True)
+            producer.start()
+
+            try:
+                while True:
+                    entry = pending.get()
+                    if entry is done:
+                        break
+                    if isinstance(entry, BaseException):
+                        raise entry
+                    for outcome in entry.result():
+                        self._handle_transformed(outcome)
+            finally:
+                stop.set()
+                producer.join()
+
+    def _transform_item(self, raw_data: Dict) -> Optional[Dict]:
+        """Transform and validate one item; None if it should be skipped."""
+        if self._custom_pre_validate and not self.pre_validate(raw_data):
+            return None
+
+        transformed = self.transform(raw_data)
+
+        if self._custom_validate:
+            return transformed if self.validate(transformed) else None
+        return transformed if transformed.get('canonical_name') else None
+
+    def _transform_chunk(self, items: list) -> list:
+        """
+        Transform a chunk of items.
+
+        Returns:
+            One outcome per item: the transformed dict, None if it should be
+            skipped, or the exception transform raised
+        """
+        outcomes = []
+        for raw_data in items:
+            try:
+                outcomes.append(self._transform_item(raw_data))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _handle_transformed(self, outcome: Union[Dict, None, Exception]):
+        """Count and save one _transform_chunk outcome."""
         self.stats['processed'] += 1
 
         try:
-            transformed = self.transform(raw_data)
+            if isinstance(outcome, Exception):
+                raise outcome
 
-            if not self.validate(transformed):
+            if outcome is None:
                 self.stats['skipped'] += 1
                 return
 
-            self._save(transformed)
+            self._save(outcome)
 
         except Exception as e:
             self.stats['errors'] += 1
             self.logger.warning(f"Error processing item: {e}")
+            self._log_message('ERROR', f"Error processing item: {e}")
+
+    def _process_item(self, raw_data: Dict):
+        """Process a single data item."""
+        for outcome in self._transform_chunk([raw_data]):
+            self._handle_transformed(outcome)
 
     def _save(self, data: Dict):
-        """Save or update a species record using UPSERT."""
-        with Session(self.engine) as session:
-            # Use UPSERT to handle duplicates atomically
-            species_id, was_inserted = self._upsert_species(session, data)
+        """Queue a species record; the queue is written every batch_size records."""
+        self._buffer.append(data)
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        """Write queued records in one transaction, falling back to one per record."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
 
-            if was_inserted:
-                self.stats['inserted'] += 1
-            else:
-                self.stats['updated'] += 1
+        try:
+            with self.engine.begin() as conn:
+                self._begin_batch(conn)
+                self._save_batch(conn, batch)
+            return
+        except Exception as e:
+            self.logger.warning(f"Batch of {len(batch)} failed ({e}), retrying per record")
+
+        # Isolate the bad records so the rest of the batch is still saved
+        for data in batch:
+            try:
+                with self.engine.begin() as conn:
+                    self._begin_batch(conn)
+                    self._save_batch(conn, [data])
+            except Exception as e:
+                self.stats['errors'] += 1
+                self.logger.warning(f"Error saving {data.get('canonical_name')}: {e}")
+                self._log_message('ERROR', f"Error saving record: {e}",
+                                  {'canonical_name': data.get('canonical_name')})
 
-            # Handle traits if present
-            if 'traits' in data:
-                self._save_traits(session, species_id, data['traits'])
+    def _begin_batch(self, conn: Connection):
+        """
+        Tune a batch transaction for a full refresh.
 
-            # Handle common names if present
-            if 'common_names' in data:
-                self._save_common_names(session, species_id, data['common_names'])
+        A full refresh can simply be rerun, so it does not wait for the WAL
+        flush on every commit. SET LOCAL ends with the transaction, so pooled
+        connections go back with their defaults.
+        """
+        if self._use_copy and conn.dialect.name == 'postgresql':
+            for setting in self._FULL_REFRESH_SETTINGS:
+                conn.execute(setting)
+
+    def _save_batch(self, conn: Connection, batch: list):
+        """Upsert a batch of species, then their traits, names and distribution."""
+        species_ids = self._upsert_species_batch(conn, batch)
+
+        # Traits for the whole batch go in one executemany
+        self._save_traits_batch(conn, [
+            (species_ids[data['canonical_name']], data['traits'])
+            for data in batch if 'traits' in data
+        ])
+
+        self._save_common_names_batch(conn, [
+            (species_ids[data['canonical_name']], data['common_names'])
+            for data in batch if 'common_names' in data
+        ])
+
+        # Brazilian distribution is only present for REFLORA
+        self._save_brazil_distribution_batch(conn, [
+            (species_ids[data['canonical_name']], data['brazil_distribution'])
+            for data in batch if 'brazil_distribution' in data
+        ])
+
+    def _upsert_species_batch(self, conn: Connection, batch: list) -> Dict[str, int]:
+        """
+        Insert or update a batch of species with one multi-row UPSERT.
 
-            # Handle Brazilian distribution if present (from REFLORA)
-            if 'brazil_distribution' in data:
-                self._save_brazil_distribution(session, species_id, data['brazil_distribution'])
+        Missing values are sent as NULL and never overwrite existing data.
 
-            session.commit()
+        Returns:
+            Dict mapping canonical_name to species id
+        """
+        # ON CONFLICT cannot touch the same row twice in one statement, so
+        # repeated names are merged, later non-empty values winning
+        rows = {}
+        for data in batch:
+            name = data['canonical_name']
+            if name in rows:
+                self.stats['updated'] += 1
+                data = {**rows[name], **{k: v for k, v in data.items() if v}}
+            rows[name] = data
 
-    def _upsert_species(self, session: Session, data: Dict) -> tuple:
+        values = [
+            [data['canonical_name'], *(data.get(col) or None for col in self._species_columns)]
+            for data in rows.values()
+        ]
+
+        columns = ('canonical_name', *self._species_columns)
+        if self._use_copy and self._copy_rows(conn, 'species', columns, values):
+            statement, params = self._upsert_template(0), {}
+        else:
+            statement = self._upsert_template(len(values))
+            params = {
+                f'v{i}_{j}': value
+                for i, row in enumerate(values)
+                for j, value in enumerate(row)
+            }
+
+        result = conn.execute(statement, params).fetchall()
+
+        species_ids = {}
+        for species_id, canonical_name, was_inserted in result:
+            species_ids[canonical_name] = species_id
+            self.stats['inserted' if was_inserted else 'updated'] += 1
+        return species_ids
+
+    def _upsert_template(self, n_rows: int):
         """
-        Insert or update a species record atomically using UPSERT.
+        Get the species UPSERT for n_rows VALUES rows, building it on first use.
 
-        Returns:
-            Tuple of (species_id, was_inserted)
-        """
-        # Build the field mappings
-        fields = ['canonical_name']
-        values = {'canonical_name': data['canonical_name']}
-
-        for col in ['genus', 'family', 'taxonomic_status']:
-            if data.get(col):
-                fields.append(col)
-                values[col] = data[col]
-
-        # Add source-specific ID
-        id_field, id_value = self._get_source_id_field(data)
-        if id_field and id_value:
-            fields.append(id_field)
-            values[id_field] = id_value
-
-        cols_str = ', '.join(fields)
-        vals_str = ', '.join(f':{f}' for f in fields)
-
-        # Build UPDATE clause for conflict (exclude canonical_name from updates)
-        update_fields = [f for f in fields if f != 'canonical_name']
-        if id_field in update_fields:
-            # Only update source ID if it was NULL
-            update_clause = ', '.join(
-                f"{f} = COALESCE(species.{f}, EXCLUDED.{f})" if f == id_field
-                else f"{f} = EXCLUDED.{f}"
-                for f in update_fields
+        Batches are almost always batch_size rows, so only a couple of
+        statements are ever built per crawler.
+        """
+        statement = self._upsert_templates.get(n_rows)
+        if statement is not None:
+            return statement
+
+        columns = ('canonical_name', *self._species_columns)
+        cols_str = ', '.join(columns)
+        if n_rows:
+            source_sql = 'VALUES ' + ', '.join(
+                '(' + ', '.join(f':v{i}_{j}' for j in range(len(columns))) + ')'
+                for i in range(n_rows)
             )
         else:
-            update_clause = ', '.join(f"{f} = EXCLUDED.{f}" for f in update_fields)
+            source_sql = f"SELECT {cols_str} FROM species_staging"
+
+        # Only fill the source ID if it was NULL
+        update_clause = ', '.join(
+            f"{col} = COALESCE(species.{col}, EXCLUDED.{col})" if col == self._id_field
+            else f"{col} = COALESCE(EXCLUDED.{col}, species.{col})"
+            for col in self._species_columns
+        )
 
-        # Use INSERT ... ON CONFLICT for atomic upsert
         # xmax = 0 means it was inserted, xmax > 0 means it was updated
-        result = session.execute(
-            text(f"""
-                INSERT INTO species ({cols_str})
-                VALUES ({vals_str})
-                ON CONFLICT (canonical_name) DO UPDATE SET
-                    {update_clause},
-                    updated_at = NOW()
-                RETURNING id, (xmax = 0) as was_inserted
-            """),
-            values
-        ).fetchone()
-
-        return result[0], result[1]
-
-    def _get_source_id_field(self, data: Dict) -> tuple:
-        """Get the source-specific ID field and value."""
-        if self.name == 'gbif' and data.get('gbif_taxon_key'):
-            return 'gbif_taxon_key', data['gbif_taxon_key']
-        elif self.name == 'reflora' and data.get('reflora_id'):
-            return 'reflora_id', data['reflora_id']
-        elif self.name == 'gift' and data.get('gift_work_id'):
-            return 'gift_work_id', data['gift_work_id']
-        elif self.name == 'wcvp' and data.get('wcvp_id'):
-            return 'wcvp_id', data['wcvp_id']
-        elif self.name == 'iucn' and data.get('iucn_taxon_id'):
-            return 'iucn_taxon_id', data['iucn_taxon_id']
-        return None, None
-
-    def _insert_species(self, session: Session, data: Dict) -> int:
-        """Insert a new species record (legacy method, use _upsert_species instead)."""
-        columns = ['canonical_name', 'genus', 'family', 'taxonomic_status']
-        source_cols = [f'{self.name}_id' if self.name != 'gbif' else 'gbif_taxon_key']
-
-        # Build dynamic insert based on available data
-        fields = []
-        values = {}
-
-        for col in columns:
-            if data.get(col):
-                fields.append(col)
-                values[col] = data[col]
-
-        # Add source-specific ID
-        if self.name == 'gbif' and data.get('gbif_taxon_key'):
-            fields.append('gbif_taxon_key')
-            values['gbif_taxon_key'] = data['gbif_taxon_key']
-        elif self.name == 'reflora' and data.get('reflora_id'):
-            fields.append('reflora_id')
-            values['reflora_id'] = data['reflora_id']
-        elif self.name == 'gift' and data.get('gift_work_id'):
-            fields.append('gift_work_id')
-            values['gift_work_id'] = data['gift_work_id']
-        elif self.name == 'wcvp' and data.get('wcvp_id'):
-            fields.append('wcvp_id')
-            values['wcvp_id'] = data['wcvp_id']
-        elif self.name == 'iucn' and data.get('iucn_taxon_id'):
-            fields.append('iucn_taxon_id')
-            values['iucn_taxon_id'] = data['iucn_taxon_id']
-
-        cols_str = ', '.join(fields)
-        vals_str = ', '.join(f':{f}' for f in fields)
-
-        result = session.execute(
-            text(f"INSERT INTO species ({cols_str}) VALUES ({vals_str}) RETURNING id"),
-            values
+        statement = text(f"""
+            INSERT INTO species ({cols_str})
+            {source_sql}
+            ON CONFLICT (canonical_name) DO UPDATE SET
+                {update_clause},
+                updated_at = NOW()
+            RETURNING id, canonical_name, (xmax = 0) as was_inserted
+        """)
+        self._upsert_templates[n_rows] = statement
+        return statement
+
+    def _copy_rows(self, conn: Connection, table: str, columns: tuple, values) -> bool:
+        """
+        COPY rows into a <table>_staging temp table dropped at commit.
+
+        Args:
+            table: Table whose column types the staging table copies
+            columns: Columns to stage, in the order of each row
+            values: Iterable of row sequences
+
+        Returns:
+            False if the driver has no COPY support (not psycopg2)
+        """
+        cursor = conn.connection.cursor()
+        if not hasattr(cursor, 'copy_expert'):
+            return False
+
+        buffer = io.StringIO()
+        # None is written as an unquoted empty field, which CSV COPY reads as NULL
+        csv.writer(buffer).writerows(values)
+        buffer.seek(0)
+
+        # Temp tables are not WAL-logged; CREATE AS copies the column types
+        # without the table's defaults, so id sequences are left alone
+        cols_str = ', '.join(columns)
+        conn.execute(text(f"""
+            CREATE TEMP TABLE {table}_staging ON COMMIT DROP AS
+            SELECT {cols_str} FROM {table} WITH NO DATA
+        """))
+        cursor.copy_expert(
+            f"COPY {table}_staging ({cols_str}) FROM STDIN WITH (FORMAT CSV)", buffer
         )
-        return result.fetchone()[0]
-
-    def _update_species(self, session: Session, species_id: int, data: Dict):
-        """Update an existing species record."""
-        # Update source-specific ID if not set
-        id_field = None
-        id_value = None
-
-        if self.name == 'gbif' and data.get('gbif_taxon_key'):
-            id_field = 'gbif_taxon_key'
-            id_value = data['gbif_taxon_key']
-        elif self.name == 'reflora' and data.get('reflora_id'):
-            id_field = 'reflora_id'
-            id_value = data['reflora_id']
-        elif self.name == 'gift' and data.get('gift_work_id'):
-            id_field = 'gift_work_id'
-            id_value = data['gift_work_id']
-        elif self.name == 'wcvp' and data.get('wcvp_id'):
-            id_field = 'wcvp_id'
-            id_value = data['wcvp_id']
-        elif self.name == 'iucn' and data.get('iucn_taxon_id'):
-            id_field = 'iucn_taxon_id'
-            id_value = data['iucn_taxon_id']
-
-        if id_field and id_value:
-            session.execute(
-                text(f"UPDATE species SET {id_field} = :val WHERE id = :id AND {id_field} IS NULL"),
-                {'val': id_value, 'id': species_id}
-            )
+        return True
 
-    def _save_traits(self, session: Session, species_id: int, traits: Dict):
+    def _save_traits(self, conn: Connection, species_id: int, traits: Dict):
         """Save species traits."""
-        # Check if traits exist for this species from this source
-        existing = session.execute(
-            text("SELECT id FROM species_traits WHERE species_id = :sid AND source = :src"),
-            {'sid': species_id, 'src': self.name}
-        ).fetchone()
-
-        if existing:
-            # Update existing traits
-            updates = []
-            values = {'id': existing[0]}
-
-            for key in ['growth_form', 'max_height_m', 'stratum', 'life_form',
-                        'woodiness', 'nitrogen_fixer', 'dispersal_syndrome', 'deciduousness',
-                        '_gift_trait_1_2_2', '_gift_trait_1_4_2']:
-                if traits.get(key) is not None:
-                    updates.append(f"{key} = :{key}")
-                    values[key] = traits[key]
-
-            if updates:
-                session.execute(
-                    text(f"UPDATE species_traits SET {', '.join(updates)} WHERE id = :id"),
-                    values
-                )
-        else:
-            # Insert new traits
-            traits['species_id'] = species_id
-            traits['source'] = self.name
-
-            fields = ['species_id', 'source']
-            for key in ['growth_form', 'max_height_m', 'stratum', 'life_form',
-                        'woodiness', 'nitrogen_fixer', 'dispersal_syndrome', 'deciduousness',
-                        '_gift_trait_1_2_2', '_gift_trait_1_4_2']:
-                if traits.get(key) is not None:
-                    fields.append(key)
-
-            cols_str = ', '.join(fields)
-            vals_str = ', '.join(f':{f}' for f in fields)
-
-            session.execute(
-                text(f"INSERT INTO species_traits ({cols_str}) VALUES ({vals_str})"),
-                {k: traits.get(k) for k in fields}
-            )
+        self._save_traits_batch(conn, [(species_id, traits)])
 
-    def _save_brazil_distribution(self, session: Session, species_id: int, distributions: list):
+    def _save_traits_batch(self, conn: Connection, rows: list):
+        """Upsert (species_id, traits) pairs into species_traits for this source."""
+        if not rows:
+            return
+        conn.execute(self._TRAITS_UPSERT, [
+            {
+                'species_id': species_id,
+                'source': self.name,
+                **{col: traits.get(col) for col in self.TRAIT_COLUMNS},
+            }
+            for species_id, traits in rows
+        ])
+
+    def _save_brazil_distribution(self, conn: Connection, species_id: int, distributions: list):
         """Save Brazilian state-level distribution data."""
-        for dist in distributions:
-            state_code = dist.get('state_code')
-            if not state_code:
-                continue
+        self._save_brazil_distribution_batch(conn, [(species_id, distributions)])
+
+    def _save_brazil_distribution_batch(self, conn: Connection, rows: list):
+        """
+        Upsert (species_id, distributions) pairs in one executemany.
 
-            # Use savepoint for error isolation
-            savepoint = session.begin_nested()
+        Like _save_common_names_batch, a failed batch is retried one
+        savepoint per state.
+        """
+        params = [
+            {
+                'sid': species_id,
+                'state': dist['state_code'],
+                'estab': dist.get('establishment'),
+                'endemic': dist.get('is_endemic', False),
+                'domains': dist.get('phytogeographic_domain'),
+                'src': self.name
+            }
+            for species_id, distributions in rows
+            for dist in distributions
+            if dist.get('state_code')
+        ]
+        if not params:
+            return
+
+        try:
+            with conn.begin_nested():
+                conn.execute(self._BRAZIL_DISTRIBUTION_UPSERT, params)
+            return
+        except Exception as e:
+            self.logger.debug(f"Distribution batch failed ({e}), retrying one by one")
+
+        for row in params:
+            savepoint = conn.begin_nested()
             try:
-                session.execute(
-                    text("""
-                        INSERT INTO species_distribution_brazil
-                            (species_id, state_code, establishment, is_endemic, phytogeographic_domain, source)
-                        VALUES (:sid, :state, :estab, :endemic, :domains, :src)
-                        ON CONFLICT (species_id, state_code) DO UPDATE SET
-                            establishment = EXCLUDED.establishment,
-                            is_endemic = EXCLUDED.is_endemic,
-                            phytogeographic_domain = EXCLUDED.phytogeographic_domain
-                    """),
-                    {
-                        'sid': species_id,
-                        'state': state_code,
-                        'estab': dist.get('establishment'),
-                        'endemic': dist.get('is_endemic', False),
-                        'domains': dist.get('phytogeographic_domain'),
-                        'src': self.name
-                    }
-                )
+                conn.execute(self._BRAZIL_DISTRIBUTION_UPSERT, row)
                 savepoint.commit()
             except Exception as e:
                 savepoint.rollback()
-                self.logger.debug(f"Skipped distribution {state_code}: {e}")
+                self.logger.debug(f"Skipped distribution {row['state']}: {e}")
+
+    def _save_common_names(self, conn: Connection, species_id: int, names: list):
+        """Save common names for a species."""
+        self._save_common_names_batch(conn, [(species_id, names)])
+
+    def _save_common_names_batch(self, conn: Connection, rows: list):
+        """
+        Insert common names for (species_id, names) pairs in one executemany.
 
-    def _save_common_names(self, session: Session, species_id: int, names: list):
-        """Save common names for a species using savepoints for error isolation."""
-        for name_data in names:
-            name = name_data.get('name', '')
-            if not name:
-                continue
+        Full refreshes COPY the names into a staging table and merge them
+        with one INSERT ... SELECT instead. The batch runs in one savepoint;
+        if it fails, names are retried one savepoint each so a bad name does
+        not abort the transaction.
+        """
+        params = []
+        for species_id, names in rows:
+            for name_data in names:
+                name = name_data.get('name', '')
+                if not name:
+                    continue
+
+                params.append({
+                    'sid': species_id,
+                    # Truncate very long names (some GBIF names are concatenated lists)
+                    'name': name[:500],
+                    'lang': name_data.get('language', 'en'),
+                    'src': self.name
+                })
+        if not params:
+            return
 
-            # Truncate very long names (some GBIF names are concatenated lists)
-            if len(name) > 500:
-                name = name[:500]
+        try:
+            with conn.begin_nested():
+                if self._use_copy and self._copy_rows(
+                    conn, 'common_names', self._COMMON_NAME_COLUMNS,
+                    ((p['sid'], p['name'], p['lang'], p['src']) for p in params)
+                ):
+                    conn.execute(self._COMMON_NAME_MERGE)
+                else:
+                    conn.execute(self._COMMON_NAME_INSERT, params)
+            return
+        except Exception as e:
+            self.logger.debug(f"Common names batch failed ({e}), retrying one by one")
 
-            # Use a savepoint so failures don't abort the entire transaction
-            savepoint = session.begin_nested()
+        for row in params:
+            savepoint = conn.begin_nested()
             try:
-                session.execute(
-                    text("""
-                        INSERT INTO common_names (species_id, common_name, language, source)
-                        VALUES (:sid, :name, :lang, :src)
-                        ON CONFLICT (species_id, common_name, language) DO NOTHING
-                    """),
-                    {
-                        'sid': species_id,
-                        'name': name,
-                        'lang': name_data.get('language', 'en'),
-                        'src': self.name
-                    }
-                )
+                conn.execute(self._COMMON_NAME_INSERT, row)
                 savepoint.commit()
-            except Exception as e:
+            except Exception:
                 savepoint.rollback()
-                self.logger.debug(f"Skipped common name (error): {name[:50]}...")
+                self.logger.debug(f"Skipped common name (error): {row['name'][:50]}...")
+
+    @contextmanager
+    def _log_transaction(self):
+        """
+        Run _log_* statements in a transaction on one connection per run.
+
+        The connection is opened on first use and released by
+        _close_log_connection once the run is logged as completed or failed.
+        """
+        if self._log_conn is None:
+            self._log_conn = self.engine.connect()
+        with self._log_conn.begin():
+            yield self._log_conn
+
+    def _close_log_connection(self):
+        """Return the logging connection to the pool between runs."""
+        if self._log_conn is not None:
+            self._log_conn.close()
+            self._log_conn = None
 
     def _log_start(self):
         """Log crawler start to database."""
-        with Session(self.engine) as session:
-            # Update status
-            session.execute(
-                text("""
-                    UPDATE crawler_status
-                    SET status = 'running', last_run = NOW()
-                    WHERE crawler_name = :name
-                """),
+        with self._log_transaction() as conn:
+            # Update status and create the run record in one statement
+            self._run_id = conn.execute(
+                self._RUN_STARTED,
                 {'name': self.name}
-            )
-
-            # Create run record
-            result = session.execute(
-                text("""
-                    INSERT INTO crawler_runs (crawler_name, started_at, status)
-                    VALUES (:name, NOW(), 'running')
-                    RETURNING id
-                """),
-                {'name': self.name}
-            )
-            self._run_id = result.fetchone()[0]
-
-            session.commit()
+            ).scalar()
 
     def _log_success(self):
         """Log successful completion."""
-        with Session(self.engine) as session:
-            session.execute(
-                text("""
-                    UPDATE crawler_status
-                    SET status = 'completed',
-                        last_success = NOW(),
-                        records_processed = :processed
-                    WHERE crawler_name = :name
-                """),
-                {'name': self.name, 'processed': self.stats['processed']}
-            )
-
-            if self._run_id:
-                session.execute(
-                    text("""
-                        UPDATE crawler_runs
-                        SET completed_at = NOW(),
-                            status = 'completed',
-                            records_processed = :processed,
-                            records_inserted = :inserted,
-                            records_updated = :updated
-                        WHERE id = :id
-                    """),
+        try:
+            with self._log_transaction() as conn:
+                self._write_log_messages(conn)
+                # No run record to update if _run_id is None
+                conn.execute(
+                    self._RUN_COMPLETED,
                     {
+                        'name': self.name,
                         'id': self._run_id,
                         'processed': self.stats['processed'],
                         'inserted': self.stats['inserted'],
                         'updated': self.stats['updated']
                     }
                 )
-
-            session.commit()
+        finally:
+            self._close_log_connection()
 
     def _log_error(self, message: str):
         """Log error to database."""
-        with Session(self.engine) as session:
-            session.execute(
-                text("""
-                    UPDATE crawler_status
-                    SET status = 'failed',
-                        error_count = error_count + 1
-                    WHERE crawler_name = :name
-                """),
-                {'name': self.name}
-            )
-
-            if self._run_id:
-                session.execute(
-                    text("""
-                        UPDATE crawler_runs
-                        SET completed_at = NOW(),
-                            status = 'failed',
-                            error_message = :msg
-                        WHERE id = :id
-                    """),
-                    {'id': self._run_id, 'msg': message}
+        self._log_message('ERROR', message)
+        try:
+            with self._log_transaction() as conn:
+                self._write_log_messages(conn)
+                conn.execute(
+                    self._RUN_FAILED,
+                    {'name': self.name, 'id': self._run_id, 'msg': message}
                 )
-
-            self._log_message('ERROR', message)
-            session.commit()
+        finally:
+            self._close_log_connection()
 
     def _log_message(self, level: str, message: str, details: dict = None):
-        """Log a message to the crawler_logs table."""
-        import json
-        with Session(self.engine) as session:
-            session.execute(
-                text("""
-                    INSERT INTO crawler_logs (crawler_name, level, message, details)
-                    VALUES (:name, :level, :msg, :details)
-                """),
-                {
-                    'name': self.name,
-                    'level': level,
-                    'msg': message,
-                    'details': json.dumps(details) if details else None
-                }
-            )
-            session.commit()
+        """
+        Queue a message for the crawler_logs table.
+
+        Messages are written every LOG_FLUSH_SIZE messages and when the run
+        is logged as completed or failed.
+        """
+        self._pending_logs.append({
+            'name': self.name,
+            'level': level,
+            'msg': message,
+            'details': details or None
+        })
+        if len(self._pending_logs) >= self.LOG_FLUSH_SIZE:
+            with self._log_transaction() as conn:
+                self._write_log_messages(conn)
+
+    def _write_log_messages(self, conn: Connection):
+        """Insert the queued crawler_logs rows."""
+        if self._pending_logs:
+            rows, self._pending_logs = self._pending_logs, []
+            conn.execute(self._LOG_INSERT, rows)
 
     def refresh_unified_tables(self, species_ids: list = None):
         """
@@ -516,7 +850,7 @@ class BaseCrawler(ABC):
         """
         self.logger.info("Refreshing unified tables...")
 
-        with Session(self.engine) as session:
+        with self.Session() as session:
             # Check if unified tables exist
             tables_exist = session.execute(text("""
                 SELECT COUNT(*) FROM information_schema.tables
@@ -537,6 +871,13 @@ class BaseCrawler(ABC):
 
         self.logger.info("Unified tables refresh complete")
 
+    def _source_rank_sql(self) -> str:
+        """SOURCE_PRIORITY as a VALUES list aliased p(src, rank), NULL rank last."""
+        ranks = ', '.join(
+            f"('{source}', {rank})" for rank, source in enumerate(self.SOURCE_PRIORITY, 1)
+        )
+        return f"(VALUES {ranks}) AS p(src, rank)"
+
     def _refresh_species_unified(self, session: Session, species_ids: list = None):
         """Refresh species_unified table with consolidated traits."""
         self.logger.info("Refreshing species_unified...")
@@ -544,13 +885,37 @@ class BaseCrawler(ABC):
         where_clause = ""
         params = {}
         if species_ids:
-            where_clause = "WHERE s.id = ANY(:ids)"
+            where_clause = "AND species_id = ANY(:ids)"
             params['ids'] = species_ids
 
-        # Upsert species_unified with priority: gift > reflora > wcvp > treegoer
-        # GIFT is prioritized for using more consistent definitions (liana vs vine)
-        # and following Renata's Climber.R logic (trait_1.2.2 + trait_1.4.2)
+        def first(column, condition=None):
+            condition = condition or f"{column} IS NOT NULL"
+            return f"(array_agg({column} ORDER BY p.rank) FILTER (WHERE {condition}))[1]"
+
+        # growth_form only comes from the ranked sources
+        growth_form_known = "growth_form IS NOT NULL AND p.src IS NOT NULL"
+
+        # One grouped pass over species_traits picks every column by source
+        # rank; unranked sources sort last
         session.execute(text(f"""
+            WITH t AS (
+                SELECT
+                    species_id,
+                    {first('growth_form', growth_form_known)} AS growth_form,
+                    {first('source', growth_form_known)} AS growth_form_source,
+                    {first('max_height_m')} AS max_height_m,
+                    {first('source', 'max_height_m IS NOT NULL')} AS height_source,
+                    {first('woodiness')} AS woodiness,
+                    {first('nitrogen_fixer')} AS nitrogen_fixer,
+                    {first('dispersal_syndrome')} AS dispersal_syndrome,
+                    {first('deciduousness')} AS deciduousness,
+                    COUNT(DISTINCT source) AS sources_count
+                FROM species_traits
+                LEFT JOIN {self._source_rank_sql()} ON p.src = source
+                WHERE species_id IS NOT NULL
+                  {where_clause}
+                GROUP BY species_id
+            )
             INSERT INTO species_unified (
                 species_id,
                 growth_form,
@@ -565,37 +930,21 @@ class BaseCrawler(ABC):
                 sources_count
             )
             SELECT
-                s.id,
-                COALESCE(
-                    (SELECT growth_form FROM species_traits WHERE species_id = s.id AND source = 'gift' AND growth_form IS NOT NULL LIMIT 1),
-                    (SELECT growth_form FROM species_traits WHERE species_id = s.id AND source = 'reflora' AND growth_form IS NOT NULL LIMIT 1),
-                    (SELECT growth_form FROM species_traits WHERE species_id = s.id AND source = 'wcvp' AND growth_form IS NOT NULL LIMIT 1),
-                    (SELECT growth_form FROM species_traits WHERE species_id = s.id AND source = 'treegoer' AND growth_form IS NOT NULL LIMIT 1)
-                ),
-                CASE
-                    WHEN EXISTS(SELECT 1 FROM species_traits WHERE species_id = s.id AND source = 'gift' AND growth_form IS NOT NULL) THEN 'gift'
-                    WHEN EXISTS(SELECT 1 FROM species_traits WHERE species_id = s.id AND source = 'reflora' AND growth_form IS NOT NULL) THEN 'reflora'
-                    WHEN EXISTS(SELECT 1 FROM species_traits WHERE species_id = s.id AND source = 'wcvp' AND growth_form IS NOT NULL) THEN 'wcvp'
-                    WHEN EXISTS(SELECT 1 FROM species_traits WHERE species_id = s.id AND source = 'treegoer' AND growth_form IS NOT NULL) THEN 'treegoer'
-                END,
-                (SELECT max_height_m FROM species_traits WHERE species_id = s.id AND max_height_m IS NOT NULL ORDER BY
-                    CASE source WHEN 'gift' THEN 1 WHEN 'reflora' THEN 2 WHEN 'wcvp' THEN 3 WHEN 'treegoer' THEN 4 ELSE 5 END
-                LIMIT 1),
-                (SELECT source FROM species_traits WHERE species_id = s.id AND max_height_m IS NOT NULL ORDER BY
-                    CASE source WHEN 'gift' THEN 1 WHEN 'reflora' THEN 2 WHEN 'wcvp' THEN 3 WHEN 'treegoer' THEN 4 ELSE 5 END
-                LIMIT 1),
-                (SELECT woodiness FROM species_traits WHERE species_id = s.id AND woodiness IS NOT NULL LIMIT 1),
-                (SELECT nitrogen_fixer FROM species_traits WHERE species_id = s.id AND nitrogen_fixer IS NOT NULL LIMIT 1),
-                (SELECT dispersal_syndrome FROM species_traits WHERE species_id = s.id AND dispersal_syndrome IS NOT NULL LIMIT 1),
-                (SELECT deciduousness FROM species_traits WHERE species_id = s.id AND deciduousness IS NOT NULL LIMIT 1),
+                t.species_id,
+                t.growth_form,
+                t.growth_form_source,
+                t.max_height_m,
+                t.height_source,
+                t.woodiness,
+                t.nitrogen_fixer,
+                t.dispersal_syndrome,
+                t.deciduousness,
                 EXISTS(
                     SELECT 1 FROM species_regions sr
-                    WHERE sr.species_id = s.id AND sr.tdwg_code LIKE 'BZ%' AND sr.is_native = TRUE
+                    WHERE sr.species_id = t.species_id AND sr.tdwg_code LIKE 'BZ%' AND sr.is_native = TRUE
                 ),
-                (SELECT COUNT(DISTINCT source) FROM species_traits WHERE species_id = s.id)
-            FROM species s
-            {where_clause}
-            AND EXISTS (SELECT 1 FROM species_traits WHERE species_id = s.id)
+                t.sources_count
+            FROM t
             ON CONFLICT (species_id) DO UPDATE SET
                 growth_form = EXCLUDED.growth_form,
                 growth_form_source = EXCLUDED.growth_form_source,
@@ -630,12 +979,24 @@ class BaseCrawler(ABC):
             return
 
         where_clause = ""
+        delete_clause = ""
         params = {}
         if species_ids:
             where_clause = "AND s.id = ANY(:ids)"
+            delete_clause = "AND species_id = ANY(:ids)"
             params['ids'] = species_ids
 
-        # Insert from wcvp_distribution
+        # Replace the wcvp rows wholesale rather than upserting each one;
+        # refresh_unified_tables commits both statements together, so
+        # readers never see the table half refreshed
+        session.execute(text(f"""
+            DELETE FROM species_regions
+            WHERE source = 'wcvp'
+              {delete_clause}
+        """), params)
+
+        # Insert from wcvp_distribution. Conflicts are only left with rows
+        # from other sources, which wcvp overrides as before.
         session.execute(text(f"""
             INSERT INTO species_regions (species_id, tdwg_code, is_native, is_endemic, is_introduced, source)
             SELECT DISTINCT
@@ -6,16 +6,26 @@ to resolve species names to accepted taxonomic names.
 
 Author: Stickybit <dev@stickybit.com.br>
 """
+import queue
 import subprocess
+import threading
+import csv
+import io
 import json
 import tempfile
 import os
 import logging
-from typing import Dict, List, Optional, Tuple
+import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import sessionmaker
 
 # Try to import rpy2 for faster processing
 try:
@@ -26,6 +36,21 @@ try:
 except ImportError:
     HAS_RPY2 = False
 
+# RapidFuzz replaces WorldFlora's fuzzy matching when installed
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# pyarrow lets pandas keep a Parquet copy of the WFO backbone
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,15 +61,24 @@ logger = logging.getLogger("crawler.disambiguation")
 # Path to WFO backbone data
 WFO_BACKBONE_PATH = Path(__file__).parent.parent / "data" / "wfo" / "classification.csv"
 
-# R script template for WFO matching
-WFO_MATCH_SCRIPT = '''
+# R exchange files live in memory when tmpfs is available
+R_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Concurrent batches each run their own R worker, so keep R single-threaded
+R_ENV = {**os.environ, 'OMP_NUM_THREADS': '1'}
+
+# R code run once by each WorldFlora worker
+WFO_WORKER_SETUP = '''
 library(WorldFlora)
 library(jsonlite)
 
 # Load backbone
 WFO.data <- read.table("{backbone_path}", sep="\\t", header=TRUE, quote="\\"",
                        fill=TRUE, stringsAsFactors=FALSE, encoding="UTF-8")
+'''
 
+# R code run by a worker for every batch
+WFO_WORKER_MATCH = '''
 # Read species names from input file
 species_names <- readLines("{input_file}")
 
@@ -61,6 +95,436 @@ output <- result[, c("spec.name.ORIG", "scientificName", "taxonID",
 write(toJSON(output, na="null"), "{output_file}")
 '''
 
+# Printed by a worker after each block of code, so Python knows it finished
+R_DONE_MARKER = '__WFO_DONE__'
+R_ERROR_MARKER = '__WFO_ERROR__'
+
+
+class WorldFloraWorker:
+    """
+    Long-lived R process with WorldFlora and the WFO backbone loaded.
+
+    Package loading and the backbone read happen once per worker instead of
+    once per batch. Code is sent on stdin; each block ends by printing
+    R_DONE_MARKER, preceded by R_ERROR_MARKER if it failed.
+    """
+
+    def __init__(self, timeout: int = 600):
+        self.timeout = timeout
+        self.process = subprocess.Popen(
+            ['R', '--vanilla', '--slave'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=R_ENV,
+            text=True
+        )
+        try:
+            self.run(WFO_WORKER_SETUP.format(backbone_path=WFO_BACKBONE_PATH))
+        except Exception:
+            # Don't leave a half-started R process behind
+            self.close()
+            raise
+
+    def run(self, code: str):
+        """Run R code, raising RuntimeError if it fails or times out."""
+        self.process.stdin.write(
+            f"tryCatch({{\n{code}\n}}, error = function(e) "
+            f"cat('{R_ERROR_MARKER}', conditionMessage(e), '\\n'))\n"
+            f"cat('{R_DONE_MARKER}\\n')\n"
+        )
+        self.process.stdin.flush()
+
+        # A stuck worker is killed, which ends the read below
+        timer = threading.Timer(self.timeout, self.process.kill)
+        timer.start()
+        try:
+            error = None
+            for line in self.process.stdout:
+                if line.startswith(R_ERROR_MARKER):
+                    error = line[len(R_ERROR_MARKER):].strip()
+                elif line.strip() == R_DONE_MARKER:
+                    break
+            else:
+                raise RuntimeError(f"R worker exited or timed out after {self.timeout}s")
+        finally:
+            timer.cancel()
+
+        if error is not None:
+            raise RuntimeError(f"R error: {error}")
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def close(self):
+        """Stop the R process, killing it if it does not exit."""
+        if self.alive:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+
+
+# WFO columns returned for every match
+WFO_COLUMNS = ['scientificName', 'taxonID', 'taxonomicStatus', 'acceptedNameUsageID',
+               'family', 'genus', 'specificEpithet']
+
+# Edit distance allowed for a RapidFuzz match, as a fraction of the name
+# length rounded up, the same rule as Fuzzy.max = 0.1 in WFO.match
+FUZZY_MAX = 0.1
+
+# Names whose first letters start no WFO name are not fuzzy matched. A typo
+# within this prefix is missed, so it is kept shorter than a genus.
+FUZZY_PREFIX_LENGTH = 3
+
+# WFO names scored per process.cdist call
+FUZZY_BLOCK_SIZE = 20_000
+
+
+def _read_wfo_backbone(path: Path) -> pd.DataFrame:
+    """
+    Read the WFO columns of the backbone, via a Parquet copy when possible.
+
+    The CSV is parsed once and saved next to it as .parquet; later runs
+    memory-map that copy until the CSV is replaced with a newer one.
+    """
+    cache = path.with_suffix('.parquet')
+    if HAS_PYARROW and cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        return pd.read_parquet(cache, columns=WFO_COLUMNS, memory_map=True)
+
+    df = pd.read_csv(path, sep='\t', usecols=WFO_COLUMNS, dtype=str,
+                     encoding='utf-8', on_bad_lines='skip')
+    if HAS_PYARROW:
+        try:
+            df.to_parquet(cache, compression='zstd', index=False)
+        except OSError as e:
+            logger.warning(f"Could not write WFO Parquet cache {cache}: {e}")
+    return df
+
+
+def load_wfo_index(path: Path = WFO_BACKBONE_PATH) -> Tuple[Dict[str, Dict], Dict[int, List[str]]]:
+    """
+    Load the WFO backbone for matching in Python.
+
+    Returns:
+        A dict of WFO rows keyed by scientific name, and every distinct
+        scientific name grouped by length. Names listed more than once
+        (homonyms) are left out of the dict, since WFO.match returns every
+        candidate for them and they still go through R.
+    """
+    df = _read_wfo_backbone(path)
+    df = df.dropna(subset=['scientificName'])
+    unique_names = pd.Series(df['scientificName'].unique())
+    names = {
+        length: group.tolist()
+        for length, group in unique_names.groupby(unique_names.str.len())
+    }
+    df = df[~df['scientificName'].duplicated(keep=False)]
+    df = df.astype(object).where(df.notna(), None)
+
+    index = dict(zip(df['scientificName'], df.to_dict('records')))
+    logger.info(f"Indexed {len(index):,} unambiguous WFO names for exact matching")
+    return index, names
+
+
+def _wfo_result(name: str, row: Dict, fuzzy_distance: Optional[int] = None) -> Dict:
+    """Build a match result from a WFO backbone row."""
+    return {
+        'original_name': name,
+        'matched': True,
+        'fuzzy': fuzzy_distance is not None,
+        'fuzzy_distance': fuzzy_distance,
+        'accepted_name': row['scientificName'],
+        'wfo_id': row['taxonID'],
+        'taxonomic_status': row['taxonomicStatus'],
+        'accepted_wfo_id': row['acceptedNameUsageID'],
+        'family': row['family'],
+        'genus': row['genus'],
+        'specific_epithet': row['specificEpithet'],
+        'source': 'wfo'
+    }
+
+
+def _from_r(value):
+    """Map R NA values (and NaN from numeric columns) to None."""
+    if value is ro.NA_Character or value is ro.NA_Logical or value is ro.NA_Integer:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def match_wfo_exact(index: Dict[str, Dict], names: List[str]) -> Tuple[List[Dict], List[str]]:
+    """
+    Resolve names that are exact, unambiguous WFO names without R.
+
+    Returns:
+        Results for the matched names, and the names left for WorldFlora
+    """
+    results = []
+    residual = []
+
+    for name in names:
+        row = index.get(name)
+        if row is None:
+            residual.append(name)
+        else:
+            results.append(_wfo_result(name, row))
+
+    return results, residual
+
+
+def wfo_name_prefixes(choices: Dict[int, List[str]]) -> Set[str]:
+    """Lowercase prefixes of all WFO names, for match_wfo_fuzzy."""
+    return {
+        name[:FUZZY_PREFIX_LENGTH].lower()
+        for names in choices.values() for name in names
+    }
+
+
+def match_wfo_fuzzy(index: Dict[str, Dict], choices: Dict[int, List[str]], prefixes: Set[str],
+                    names: List[str], workers: int = -1) -> Tuple[List[Dict], List[str]]:
+    """
+    Fuzzy match names against all WFO names with RapidFuzz.
+
+    A name can only be within k edits of names whose length differs by at
+    most k, so each length group of choices is scored only against the names
+    that can reach it. Names whose prefix starts no WFO name are not scored
+    at all. Scoring uses process.cdist with `workers` threads (-1 for all
+    cores), one block of choices at a time to bound the size of the
+    distance matrix.
+
+    Names without a close enough WFO name are returned as unmatched; names
+    whose closest WFO name is a homonym are left for WorldFlora.
+
+    Returns:
+        Results for the resolved names, and the names left for WorldFlora
+    """
+    results = []
+    residual = []
+
+    queries = []
+    for name in names:
+        if name[:FUZZY_PREFIX_LENGTH].lower() in prefixes:
+            queries.append(name)
+        else:
+            results.append({'original_name': name, 'matched': False, 'source': 'wfo'})
+
+    lengths = np.array([len(q) for q in queries])
+    max_distances = np.ceil(FUZZY_MAX * lengths).astype(int)
+    best_distances = max_distances + 1
+    best_names: List[Optional[str]] = [None] * len(queries)
+
+    for length, group in choices.items():
+        rows = np.flatnonzero(np.abs(lengths - length) <= max_distances)
+        if not rows.size:
+            continue
+        row_queries = [queries[i] for i in rows]
+        cutoff = int(max_distances[rows].max())
+
+        for start in range(0, len(group), FUZZY_BLOCK_SIZE):
+            block = group[start:start + FUZZY_BLOCK_SIZE]
+            distances = process.cdist(row_queries, block, scorer=Levenshtein.distance,
+                                      score_cutoff=cutoff, dtype=np.int16, workers=workers)
+            nearest = distances.argmin(axis=1)
+            nearest_distances = distances[np.arange(len(rows)), nearest]
+
+            better = nearest_distances < best_distances[rows]
+            best_distances[rows[better]] = nearest_distances[better]
+            for row, column in zip(rows[better], nearest[better]):
+                best_names[row] = block[column]
+
+    for name, hit, distance in zip(queries, best_names, best_distances):
+        if hit is None:
+            results.append({'original_name': name, 'matched': False, 'source': 'wfo'})
+        elif hit in index:
+            results.append(_wfo_result(name, index[hit], int(distance)))
+        else:
+            residual.append(name)
+
+    return results, residual
+
+def fan_out_results(results: List[Dict], names: List[str]) -> List[Dict]:
+    """Repeat results for names that appear more than once in names."""
+    counts = Counter(names)
+    extra = []
+    for r in results:
+        extra.extend([r] * (counts.get(r['original_name'], 1) - 1))
+    return results + extra
+
+def iter_species_without_wfo(Session, chunk_size: int) -> Iterator[List[str]]:
+    """
+    Stream names of species without a WFO ID in lists of chunk_size.
+
+    Uses a server-side cursor, so only one chunk is held in memory. The
+    cursor reads a snapshot, so updates made by the caller between chunks
+    do not affect which names are returned.
+    """
+    with Session() as session:
+        result = session.execute(
+            text("SELECT canonical_name FROM species WHERE wfo_id IS NULL ORDER BY canonical_name")
+            .execution_options(stream_results=True, yield_per=chunk_size)
+        )
+        for partition in result.partitions(chunk_size):
+            yield [row[0] for row in partition]
+
+# WCVP lookups for a whole batch of names: one query for exact matches and
+# one for the best trigram match of each remaining name (needs pg_trgm)
+WCVP_EXACT_MATCH = text("""
+    SELECT canonical_name, family, genus, taxonomic_status, wcvp_id
+    FROM species
+    WHERE canonical_name = ANY(:names) AND wcvp_id IS NOT NULL
+""")
+
+# The % threshold is raised to the accepted similarity for the fuzzy query,
+# and <-> lets the trigram index (migration 018) return the nearest name first
+WCVP_MIN_SIMILARITY = 0.7
+
+WCVP_FUZZY_THRESHOLD = text(
+    "SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"
+)
+
+WCVP_FUZZY_MATCH = text("""
+    SELECT q.name, t.canonical_name, t.family, t.genus, t.taxonomic_status,
+           t.wcvp_id, t.sim
+    FROM unnest(CAST(:names AS text[])) AS q(name)
+    CROSS JOIN LATERAL (
+        SELECT canonical_name, family, genus, taxonomic_status, wcvp_id,
+               similarity(canonical_name, q.name) as sim
+        FROM species
+        WHERE wcvp_id IS NOT NULL
+          AND canonical_name % q.name
+        ORDER BY canonical_name <-> q.name
+        LIMIT 1
+    ) t
+    WHERE t.sim > :min_sim
+""")
+
+
+def match_wcvp(conn: Connection, names: List[str], fuzzy: bool = True) -> List[Dict]:
+    """
+    Match names against WCVP data in database.
+
+    Args:
+        conn: Open database connection
+        names: Scientific names to resolve
+        fuzzy: Also try a trigram match for names without an exact match
+
+    Returns:
+        One result dict per name, in input order
+    """
+    matches = {}
+
+    try:
+        for row in conn.execute(WCVP_EXACT_MATCH, {'names': list(names)}):
+            matches[row.canonical_name] = {
+                'matched': True,
+                'fuzzy': False,
+                'accepted_name': row.canonical_name,
+                'wcvp_id': row.wcvp_id,
+                'taxonomic_status': row.taxonomic_status,
+                'family': row.family,
+                'genus': row.genus,
+            }
+    except Exception as e:
+        logger.debug(f"WCVP exact match error: {e}")
+        conn.rollback()
+
+    remaining = [n for n in dict.fromkeys(names) if n not in matches]
+    if fuzzy and remaining:
+        try:
+            conn.execute(WCVP_FUZZY_THRESHOLD, {'threshold': str(WCVP_MIN_SIMILARITY)})
+            rows = conn.execute(WCVP_FUZZY_MATCH, {
+                'names': remaining, 'min_sim': WCVP_MIN_SIMILARITY
+            })
+            for row in rows:
+                matches[row.name] = {
+                    'matched': True,
+                    'fuzzy': True,
+                    'fuzzy_distance': 1 - row.sim,
+                    'accepted_name': row.canonical_name,
+                    'wcvp_id': row.wcvp_id,
+                    'taxonomic_status': row.taxonomic_status,
+                    'family': row.family,
+                    'genus': row.genus,
+                }
+        except Exception as e:
+            # pg_trgm extension not available or other error - keep exact matches only
+            logger.debug(f"WCVP fuzzy match skipped: {e}")
+            conn.rollback()
+
+    return [
+        {'original_name': name, **matches.get(name, {'matched': False}), 'source': 'wcvp'}
+        for name in names
+    ]
+
+
+# WFO matches of a batch are loaded into a temp table, then applied to
+# species in one statement
+WFO_MATCHES_STAGING = text("""
+    CREATE TEMP TABLE wfo_matches (
+        name TEXT, wfo_id TEXT, status TEXT, family TEXT, genus TEXT
+    ) ON COMMIT DROP
+""")
+
+WFO_MATCHES_INSERT = text("""
+    INSERT INTO wfo_matches (name, wfo_id, status, family, genus)
+    VALUES (:name, :wfo_id, :status, :family, :genus)
+""")
+
+WFO_SPECIES_UPDATE = text("""
+    UPDATE species s
+    SET wfo_id = v.wfo_id,
+        taxonomic_status = COALESCE(s.taxonomic_status, v.status),
+        family = COALESCE(s.family, v.family),
+        genus = COALESCE(s.genus, v.genus),
+        updated_at = NOW()
+    FROM wfo_matches v
+    WHERE s.canonical_name = v.name
+""")
+
+
+def update_species_wfo(session, results: List[Dict]) -> int:
+    """
+    Write WFO matches from disambiguation results to the species table.
+
+    Args:
+        session: Open database session; the caller commits
+        results: Disambiguation results from disambiguate_batch
+
+    Returns:
+        Number of matched results (WFO and WCVP)
+    """
+    matched = [r for r in results if r.get('matched')]
+    rows = [
+        (r['original_name'], r.get('wfo_id'), (r.get('taxonomic_status') or '').lower() or None,
+         r.get('family'), r.get('genus'))
+        for r in matched if r['source'] == 'wfo'
+    ]
+    if not rows:
+        return len(matched)
+
+    conn = session.connection()
+    conn.execute(WFO_MATCHES_STAGING)
+
+    cursor = conn.connection.cursor()
+    if hasattr(cursor, 'copy_expert'):
+        buffer = io.StringIO()
+        # CSV COPY reads the unquoted empty field written for None as NULL
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor.copy_expert("COPY wfo_matches FROM STDIN WITH (FORMAT CSV)", buffer)
+    else:
+        conn.execute(WFO_MATCHES_INSERT, [
+            dict(zip(('name', 'wfo_id', 'status', 'family', 'genus'), row)) for row in rows
+        ])
+
+    conn.execute(WFO_SPECIES_UPDATE)
+    return len(matched)
+
 
 class TaxonomicDisambiguator:
     """
@@ -71,10 +535,14 @@ class TaxonomicDisambiguator:
     2. WCVP data in database - fallback for unmatched
     """
 
+    # Batches matched against WFO at the same time; each one that needs R
+    # uses its own R worker with a copy of the backbone
+    max_workers = 4
+
     def __init__(self, db_url: str):
         """Initialize with database connection."""
         self.engine = create_engine(db_url)
-        self.Session = sessionmaker(bind=self.engine)
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.stats = {
             'total': 0,
             'wfo_matched': 0,
@@ -92,6 +560,19 @@ class TaxonomicDisambiguator:
             )
 
         logger.info(f"Using WFO backbone: {WFO_BACKBONE_PATH}")
+        self.wfo_exact, self.wfo_names = load_wfo_index()
+        self.wfo_prefixes = wfo_name_prefixes(self.wfo_names)
+
+        # Idle WorldFloraWorker processes, started on first use
+        self._r_workers: queue.Queue = queue.Queue()
+        # Set when a worker fails to start; later batches skip R instead of
+        # starting another process that would fail the same way
+        self._r_setup_error: Optional[Exception] = None
+
+    def close(self):
+        """Stop the R workers."""
+        while not self._r_workers.empty():
+            self._r_workers.get_nowait().close()
 
     def disambiguate_batch(self, species_names: List[str], batch_size: int = 1000) -> List[Dict]:
         """
@@ -105,74 +586,92 @@ class TaxonomicDisambiguator:
             List of dicts with disambiguation results
         """
         results = []
+        # Duplicate names are matched once and copied back at the end
+        unique_names = list(dict.fromkeys(species_names))
+        batches = [unique_names[i:i+batch_size] for i in range(0, len(unique_names), batch_size)]
 
-        for i in range(0, len(species_names), batch_size):
-            batch = species_names[i:i+batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} names)")
+        # WFO matching is mostly spent in R worker processes, so threads
+        # are enough to keep several of them busy
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            wfo_batches = executor.map(self._match_wfo, batches)
 
-            # First try WFO
-            wfo_results = self._match_wfo(batch)
+            for batch_num, wfo_results in enumerate(wfo_batches, 1):
+                logger.info(f"Processing batch {batch_num}/{len(batches)} ({len(wfo_results)} WFO results)")
+                results.extend(self._resolve_wfo_results(wfo_results))
 
-            # Collect unmatched for WCVP fallback
-            unmatched = []
-            for r in wfo_results:
+        self.stats['total'] += len(species_names)
+        return fan_out_results(results, species_names)
+
+    def _resolve_wfo_results(self, wfo_results: List[Dict]) -> List[Dict]:
+        """Count WFO matches and fall back to WCVP for the unmatched names."""
+        results = []
+
+        # Collect unmatched for WCVP fallback
+        unmatched = []
+        for r in wfo_results:
+            if r.get('matched'):
+                results.append(r)
+                if r.get('fuzzy'):
+                    self.stats['wfo_fuzzy'] += 1
+                else:
+                    self.stats['wfo_matched'] += 1
+            else:
+                unmatched.append(r['original_name'])
+
+        # Try WCVP for unmatched
+        if unmatched:
+            wcvp_results = self._match_wcvp(unmatched)
+            for r in wcvp_results:
                 if r.get('matched'):
-                    results.append(r)
-                    if r.get('fuzzy'):
-                        self.stats['wfo_fuzzy'] += 1
-                    else:
-                        self.stats['wfo_matched'] += 1
+                    self.stats['wcvp_matched'] += 1
                 else:
-                    unmatched.append(r['original_name'])
+                    self.stats['unmatched'] += 1
+                results.append(r)
 
-            # Try WCVP for unmatched
-            if unmatched:
-                wcvp_results = self._match_wcvp(unmatched)
-                for r in wcvp_results:
-                    if r.get('matched'):
-                        self.stats['wcvp_matched'] += 1
-                    else:
-                        self.stats['unmatched'] += 1
-                    results.append(r)
-
-        self.stats['total'] = len(species_names)
         return results
 
     def _match_wfo(self, names: List[str]) -> List[Dict]:
+        """Match names against WFO, calling R only for names Python cannot resolve."""
+        results, residual = match_wfo_exact(self.wfo_exact, names)
+        if residual and HAS_RAPIDFUZZ:
+            # Already one of max_workers pool threads; a cdist thread per
+            # core on each of them would oversubscribe the machine
+            fuzzy_results, residual = match_wfo_fuzzy(
+                self.wfo_exact, self.wfo_names, self.wfo_prefixes, residual, workers=1
+            )
+            results.extend(fuzzy_results)
+        if residual:
+            results.extend(self._match_wfo_r(residual))
+        return results
+
+    def _match_wfo_r(self, names: List[str]) -> List[Dict]:
         """Match names against WFO using R WorldFlora package."""
         results = []
 
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f_in:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, dir=R_TEMP_DIR) as f_in:
                 f_in.write('\n'.join(names))
                 input_file = f_in.name
 
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f_out:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, dir=R_TEMP_DIR) as f_out:
                 output_file = f_out.name
 
-            # Generate R script
-            script = WFO_MATCH_SCRIPT.format(
-                backbone_path=str(WFO_BACKBONE_PATH),
-                input_file=input_file,
-                output_file=output_file
-            )
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.R', delete=False) as f_script:
-                f_script.write(script)
-                script_file = f_script.name
-
-            # Execute R script
-            result = subprocess.run(
-                ['Rscript', script_file],
-                capture_output=True,
-                text=True,
-                timeout=600
-            )
-
-            if result.returncode != 0:
-                logger.error(f"R script failed: {result.stderr}")
-                # Return unmatched for all
-                return [{'original_name': n, 'matched': False, 'source': 'wfo'} for n in names]
+            # Run the batch on an idle R worker, starting one if none is free
+            try:
+                worker = self._r_workers.get_nowait()
+            except queue.Empty:
+                if self._r_setup_error is not None:
+                    raise RuntimeError(f"R worker unavailable: {self._r_setup_error}")
+                try:
+                    worker = WorldFloraWorker()
+                except Exception as e:
+                    self._r_setup_error = e
+                    raise
+            try:
+                worker.run(WFO_WORKER_MATCH.format(input_file=input_file, output_file=output_file))
+            finally:
+                if worker.alive:
+                    self._r_workers.put(worker)
 
             # Parse results
             with open(output_file, 'r') as f:
@@ -195,16 +694,13 @@ class TaxonomicDisambiguator:
                     'source': 'wfo'
                 })
 
-        except subprocess.TimeoutExpired:
-            logger.error("WFO matching timed out")
-            results = [{'original_name': n, 'matched': False, 'source': 'wfo'} for n in names]
         except Exception as e:
             logger.error(f"WFO matching error: {e}")
             self.stats['errors'] += 1
             results = [{'original_name': n, 'matched': False, 'source': 'wfo'} for n in names]
         finally:
             # Cleanup temp files
-            for f in [input_file, output_file, script_file]:
+            for f in [input_file, output_file]:
                 try:
                     os.unlink(f)
                 except:
@@ -213,87 +709,9 @@ class TaxonomicDisambiguator:
         return results
 
     def _match_wcvp(self, names: List[str]) -> List[Dict]:
-        """Match names against WCVP data in database."""
-        results = []
-
-        for name in names:
-            matched = False
-
-            # Try exact match first
-            with Session(self.engine) as session:
-                try:
-                    row = session.execute(
-                        text("""
-                            SELECT id, canonical_name, family, genus, taxonomic_status, wcvp_id
-                            FROM species
-                            WHERE canonical_name = :name AND wcvp_id IS NOT NULL
-                            LIMIT 1
-                        """),
-                        {'name': name}
-                    ).fetchone()
-
-                    if row:
-                        results.append({
-                            'original_name': name,
-                            'matched': True,
-                            'fuzzy': False,
-                            'accepted_name': row.canonical_name,
-                            'wcvp_id': row.wcvp_id,
-                            'taxonomic_status': row.taxonomic_status,
-                            'family': row.family,
-                            'genus': row.genus,
-                            'source': 'wcvp'
-                        })
-                        matched = True
-
-                except Exception as e:
-                    logger.debug(f"WCVP exact match error for {name}: {e}")
-
-            if matched:
-                continue
-
-            # Try fuzzy match in a separate session (pg_trgm extension required)
-            with Session(self.engine) as session:
-                try:
-                    row = session.execute(
-                        text("""
-                            SELECT id, canonical_name, family, genus, taxonomic_status, wcvp_id,
-                                   similarity(canonical_name, :name) as sim
-                            FROM species
-                            WHERE wcvp_id IS NOT NULL
-                              AND canonical_name % :name
-                            ORDER BY sim DESC
-                            LIMIT 1
-                        """),
-                        {'name': name}
-                    ).fetchone()
-
-                    if row and row.sim > 0.7:
-                        results.append({
-                            'original_name': name,
-                            'matched': True,
-                            'fuzzy': True,
-                            'fuzzy_distance': 1 - row.sim,
-                            'accepted_name': row.canonical_name,
-                            'wcvp_id': row.wcvp_id,
-                            'taxonomic_status': row.taxonomic_status,
-                            'family': row.family,
-                            'genus': row.genus,
-                            'source': 'wcvp'
-                        })
-                        matched = True
-                except Exception:
-                    # pg_trgm extension not available or other error - skip fuzzy
-                    pass
-
-            if not matched:
-                results.append({
-                    'original_name': name,
-                    'matched': False,
-                    'source': 'wcvp'
-                })
-
-        return results
+        """Match names against WCVP data in database (exact, then fuzzy)."""
+        with self.engine.connect() as conn:
+            return match_wcvp(conn, names, fuzzy=True)
 
     def update_species_table(self, results: List[Dict]) -> int:
         """
@@ -304,39 +722,8 @@ class TaxonomicDisambiguator:
         Returns:
             Number of records updated
         """
-        updated = 0
-
-        with Session(self.engine) as session:
-            for r in results:
-                if not r.get('matched'):
-                    continue
-
-                try:
-                    # Update species record with disambiguation info
-                    if r['source'] == 'wfo':
-                        session.execute(
-                            text("""
-                                UPDATE species
-                                SET wfo_id = :wfo_id,
-                                    taxonomic_status = COALESCE(taxonomic_status, :status),
-                                    family = COALESCE(family, :family),
-                                    genus = COALESCE(genus, :genus),
-                                    updated_at = NOW()
-                                WHERE canonical_name = :name
-                            """),
-                            {
-                                'wfo_id': r.get('wfo_id'),
-                                'status': r.get('taxonomic_status', '').lower(),
-                                'family': r.get('family'),
-                                'genus': r.get('genus'),
-                                'name': r['original_name']
-                            }
-                        )
-                    updated += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to update {r['original_name']}: {e}")
-
+        with self.Session() as session:
+            updated = update_species_wfo(session, results)
             session.commit()
 
         return updated
@@ -350,26 +737,20 @@ class TaxonomicDisambiguator:
         """
         logger.info("Starting full taxonomic disambiguation")
 
-        # Get all species names
-        with Session(self.engine) as session:
-            rows = session.execute(
-                text("SELECT canonical_name FROM species WHERE wfo_id IS NULL ORDER BY canonical_name")
-            ).fetchall()
-
-        species_names = [r[0] for r in rows]
-        logger.info(f"Found {len(species_names)} species without WFO ID")
+        # Names are streamed and written back chunk by chunk
+        updated = 0
+        try:
+            for species_names in iter_species_without_wfo(self.Session, batch_size * self.max_workers):
+                results = self.disambiguate_batch(species_names, batch_size=batch_size)
+                updated += self.update_species_table(results)
+                logger.info(f"Updated {updated} species records so far")
+        finally:
+            self.close()
 
-        if not species_names:
+        if not self.stats['total']:
             logger.info("No species to process")
             return self.stats
 
-        # Process in batches
-        results = self.disambiguate_batch(species_names, batch_size=batch_size)
-
-        # Update database
-        updated = self.update_species_table(results)
-        logger.info(f"Updated {updated} species records")
-
         # Log statistics
         logger.info(f"Disambiguation complete: {self.stats}")
 
@@ -390,7 +771,7 @@ class TaxonomicDisambiguatorFast:
             raise RuntimeError("rpy2 is required for TaxonomicDisambiguatorFast. Install with: pip install rpy2")
 
         self.engine = create_engine(db_url)
-        self.Session = sessionmaker(bind=self.engine)
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.stats = {
             'total': 0,
             'wfo_matched': 0,
@@ -408,12 +789,12 @@ class TaxonomicDisambiguatorFast:
             )
 
         logger.info(f"Using WFO backbone: {WFO_BACKBONE_PATH}")
+        self.wfo_exact, self.wfo_names = load_wfo_index()
+        self.wfo_prefixes = wfo_name_prefixes(self.wfo_names)
         logger.info("Loading WFO backbone into R memory (this may take a few minutes)...")
 
         # Initialize rpy2 and load packages
-        pandas2ri.activate()
         self.worldflora = importr('WorldFlora')
-        self.jsonlite = importr('jsonlite')
 
         # Load backbone into R global environment
         ro.r(f'''
@@ -423,7 +804,19 @@ class TaxonomicDisambiguatorFast:
         logger.info("WFO backbone loaded into memory")
 
     def _match_wfo_batch(self, names: List[str]) -> List[Dict]:
-        """Match a batch of names against WFO using in-memory data."""
+        """Match a batch of names against WFO, calling R only for names Python cannot resolve."""
+        results, residual = match_wfo_exact(self.wfo_exact, names)
+        if residual and HAS_RAPIDFUZZ:
+            fuzzy_results, residual = match_wfo_fuzzy(
+                self.wfo_exact, self.wfo_names, self.wfo_prefixes, residual
+            )
+            results.extend(fuzzy_results)
+        if residual:
+            results.extend(self._match_wfo_r(residual))
+        return results
+
+    def _match_wfo_r(self, names: List[str]) -> List[Dict]:
+        """Match names against WFO using in-memory R data."""
         results = []
 
         try:
@@ -440,9 +833,13 @@ class TaxonomicDisambiguatorFast:
                                      "genus", "specificEpithet", "Matched", "Fuzzy", "Fuzzy.dist")]
             ''')
 
-            # Convert to Python via JSON
-            json_str = ro.r('toJSON(output, na="null")')[0]
-            wfo_data = json.loads(json_str)
+            # Convert the data.frame straight to pandas, without a JSON round trip
+            with (ro.default_converter + pandas2ri.converter).context():
+                output = ro.conversion.get_conversion().rpy2py(ro.globalenv['output'])
+            wfo_data = [
+                {column: _from_r(value) for column, value in row.items()}
+                for row in output.to_dict('records')
+            ]
 
             for row in wfo_data:
                 matched = row.get('Matched', False)
@@ -471,10 +868,12 @@ class TaxonomicDisambiguatorFast:
     def disambiguate_batch(self, species_names: List[str], batch_size: int = 1000) -> List[Dict]:
         """Disambiguate a batch of species names using in-memory WFO data."""
         results = []
-        total_batches = (len(species_names) + batch_size - 1) // batch_size
+        # Duplicate names are matched once and copied back at the end
+        unique_names = list(dict.fromkeys(species_names))
+        total_batches = (len(unique_names) + batch_size - 1) // batch_size
 
-        for i in range(0, len(species_names), batch_size):
-            batch = species_names[i:i+batch_size]
+        for i in range(0, len(unique_names), batch_size):
+            batch = unique_names[i:i+batch_size]
             batch_num = i // batch_size + 1
             logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} names)")
 
@@ -507,89 +906,18 @@ class TaxonomicDisambiguatorFast:
             matched_so_far = self.stats['wfo_matched'] + self.stats['wfo_fuzzy'] + self.stats['wcvp_matched']
             logger.info(f"  Batch complete: {matched_so_far} matched, {self.stats['unmatched']} unmatched")
 
-        self.stats['total'] = len(species_names)
-        return results
+        self.stats['total'] += len(species_names)
+        return fan_out_results(results, species_names)
 
     def _match_wcvp(self, names: List[str]) -> List[Dict]:
-        """Match names against WCVP data in database."""
-        results = []
-
-        for name in names:
-            matched = False
-
-            # Try exact match first
-            with Session(self.engine) as session:
-                try:
-                    row = session.execute(
-                        text("""
-                            SELECT id, canonical_name, family, genus, taxonomic_status, wcvp_id
-                            FROM species
-                            WHERE canonical_name = :name AND wcvp_id IS NOT NULL
-                            LIMIT 1
-                        """),
-                        {'name': name}
-                    ).fetchone()
-
-                    if row:
-                        results.append({
-                            'original_name': name,
-                            'matched': True,
-                            'fuzzy': False,
-                            'accepted_name': row.canonical_name,
-                            'wcvp_id': row.wcvp_id,
-                            'taxonomic_status': row.taxonomic_status,
-                            'family': row.family,
-                            'genus': row.genus,
-                            'source': 'wcvp'
-                        })
-                        matched = True
-
-                except Exception as e:
-                    logger.debug(f"WCVP exact match error for {name}: {e}")
-
-            if not matched:
-                results.append({
-                    'original_name': name,
-                    'matched': False,
-                    'source': 'wcvp'
-                })
-
-        return results
+        """Match names against WCVP data in database (exact only)."""
+        with self.engine.connect() as conn:
+            return match_wcvp(conn, names, fuzzy=False)
 
     def update_species_table(self, results: List[Dict]) -> int:
         """Update species table with disambiguation results."""
-        updated = 0
-
-        with Session(self.engine) as session:
-            for r in results:
-                if not r.get('matched'):
-                    continue
-
-                try:
-                    if r['source'] == 'wfo':
-                        session.execute(
-                            text("""
-                                UPDATE species
-                                SET wfo_id = :wfo_id,
-                                    taxonomic_status = COALESCE(taxonomic_status, :status),
-                                    family = COALESCE(family, :family),
-                                    genus = COALESCE(genus, :genus),
-                                    updated_at = NOW()
-                                WHERE canonical_name = :name
-                            """),
-                            {
-                                'wfo_id': r.get('wfo_id'),
-                                'status': r.get('taxonomic_status', '').lower(),
-                                'family': r.get('family'),
-                                'genus': r.get('genus'),
-                                'name': r['original_name']
-                            }
-                        )
-                    updated += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to update {r['original_name']}: {e}")
-
+        with self.Session() as session:
+            updated = update_species_wfo(session, results)
             session.commit()
 
         return updated
@@ -598,26 +926,17 @@ class TaxonomicDisambiguatorFast:
         """Run disambiguation on all species in database."""
         logger.info("Starting full taxonomic disambiguation (fast mode)")
 
-        # Get all species names
-        with Session(self.engine) as session:
-            rows = session.execute(
-                text("SELECT canonical_name FROM species WHERE wfo_id IS NULL ORDER BY canonical_name")
-            ).fetchall()
-
-        species_names = [r[0] for r in rows]
-        logger.info(f"Found {len(species_names)} species without WFO ID")
+        # Names are streamed and written back chunk by chunk
+        updated = 0
+        for species_names in iter_species_without_wfo(self.Session, batch_size):
+            results = self.disambiguate_batch(species_names, batch_size=batch_size)
+            updated += self.update_species_table(results)
+            logger.info(f"Updated {updated} species records so far")
 
-        if not species_names:
+        if not self.stats['total']:
             logger.info("No species to process")
             return self.stats
 
-        # Process in batches
-        results = self.disambiguate_batch(species_names, batch_size=batch_size)
-
-        # Update database
-        updated = self.update_species_table(results)
-        logger.info(f"Updated {updated} species records")
-
         # Log statistics
         logger.info(f"Disambiguation complete: {self.stats}")
 
@@ -632,10 +951,14 @@ class TaxonomicDisambiguatorSQL:
     Much faster than R-based approaches for large datasets.
     """
 
+    # Minimum trigram similarity for a fuzzy match, close to the
+    # Fuzzy.max = 0.1 distance used with WorldFlora
+    FUZZY_THRESHOLD = 0.9
+
     def __init__(self, db_url: str):
         """Initialize with database connection."""
         self.engine = create_engine(db_url)
-        self.Session = sessionmaker(bind=self.engine)
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.stats = {
             'total': 0,
             'wfo_matched': 0,
@@ -646,44 +969,68 @@ class TaxonomicDisambiguatorSQL:
         }
 
         # Verify WFO backbone table exists
-        with Session(self.engine) as session:
+        with self.Session() as session:
             result = session.execute(text("SELECT COUNT(*) FROM wfo_backbone"))
             count = result.scalar()
             if count == 0:
                 raise RuntimeError("WFO backbone table is empty. Run import first.")
             logger.info(f"Using WFO backbone table with {count:,} records")
 
-    def run_full_disambiguation(self, batch_size: int = 10000) -> Dict:
-        """
-        Run disambiguation using SQL JOINs - much faster than R.
+    @staticmethod
+    def _wfo_has_match_key(session) -> bool:
+        """Whether wfo_backbone has the match_key column from migration 017."""
+        return session.execute(text("""
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'wfo_backbone' AND column_name = 'match_key'
+            )
+        """)).scalar()
 
-        This method updates the species table directly using SQL.
+    def match_exact(self) -> int:
         """
-        logger.info("Starting SQL-based taxonomic disambiguation")
+        Resolve species that match wfo_backbone exactly (steps 1 and 2).
 
-        # Step 1: Direct match on scientific_name
+        Returns:
+            Number of species matched
+        """
+        # Step 1: Direct match on the normalized name (migration 017). That
+        # migration only adds wfo_backbone.match_key if the backbone was
+        # already imported, so fall back to the raw name otherwise. Keys
+        # shared by several WFO species are left for the later steps
+        # rather than resolved to an arbitrary one of them.
         logger.info("Step 1: Matching species by scientific name...")
-        with Session(self.engine) as session:
-            result = session.execute(text("""
+        with self.Session() as session:
+            if self._wfo_has_match_key(session):
+                species_key, wfo_key = 's.match_key', 'match_key'
+            else:
+                logger.info("  wfo_backbone.match_key missing (run migration 017); matching raw names")
+                species_key, wfo_key = 's.canonical_name', 'scientific_name'
+
+            result = session.execute(text(f"""
                 UPDATE species s
                 SET wfo_id = w.taxon_id,
                     taxonomic_status = COALESCE(s.taxonomic_status, LOWER(w.taxonomic_status)),
                     family = COALESCE(s.family, w.family),
                     genus = COALESCE(s.genus, w.genus),
                     updated_at = NOW()
-                FROM wfo_backbone w
+                FROM (
+                    SELECT {wfo_key} AS join_key, taxon_id, taxonomic_status, family, genus,
+                           COUNT(*) OVER (PARTITION BY {wfo_key}) AS candidates
+                    FROM wfo_backbone
+                    WHERE taxon_rank = 'species'
+                ) w
                 WHERE s.wfo_id IS NULL
-                  AND s.canonical_name = w.scientific_name
-                  AND w.taxon_rank = 'species'
+                  AND {species_key} = w.join_key
+                  AND w.candidates = 1
             """))
             session.commit()
             exact_matches = result.rowcount
             self.stats['wfo_matched'] = exact_matches
             logger.info(f"  Exact matches: {exact_matches:,}")
 
-        # Step 2: Match by genus + specific_epithet
+        # Step 2: Match by genus + specific_epithet (stored column, migration 016)
         logger.info("Step 2: Matching by genus + epithet...")
-        with Session(self.engine) as session:
+        with self.Session() as session:
             result = session.execute(text("""
                 UPDATE species s
                 SET wfo_id = w.taxon_id,
@@ -694,7 +1041,7 @@ class TaxonomicDisambiguatorSQL:
                 FROM wfo_backbone w
                 WHERE s.wfo_id IS NULL
                   AND s.genus = w.genus
-                  AND SPLIT_PART(s.canonical_name, ' ', 2) = w.specific_epithet
+                  AND s.specific_epithet = w.specific_epithet
                   AND w.taxon_rank = 'species'
             """))
             session.commit()
@@ -702,16 +1049,64 @@ class TaxonomicDisambiguatorSQL:
             self.stats['wfo_matched'] += genus_matches
             logger.info(f"  Genus+epithet matches: {genus_matches:,}")
 
-        # Step 3: Count remaining unmatched
-        with Session(self.engine) as session:
-            result = session.execute(text("SELECT COUNT(*) FROM species WHERE wfo_id IS NULL"))
-            unmatched = result.scalar()
-            self.stats['unmatched'] = unmatched
+        return self.stats['wfo_matched']
 
-        # Get total
-        with Session(self.engine) as session:
-            result = session.execute(text("SELECT COUNT(*) FROM species"))
-            self.stats['total'] = result.scalar()
+    def run_full_disambiguation(self, batch_size: int = 10000) -> Dict:
+        """
+        Run disambiguation using SQL JOINs - much faster than R.
+
+        This method updates the species table directly using SQL.
+        """
+        logger.info("Starting SQL-based taxonomic disambiguation")
+        self.match_exact()
+
+        # Step 3: Fuzzy match the rest by trigram similarity (migration 015).
+        # The threshold also drives the % operator, so the trigram index
+        # only returns close candidates.
+        logger.info("Step 3: Fuzzy matching by trigram similarity...")
+        with self.Session() as session:
+            try:
+                session.execute(
+                    text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+                    {'threshold': str(self.FUZZY_THRESHOLD)}
+                )
+                result = session.execute(text("""
+                    UPDATE species s
+                    SET wfo_id = w.taxon_id,
+                        taxonomic_status = COALESCE(s.taxonomic_status, LOWER(w.taxonomic_status)),
+                        family = COALESCE(s.family, w.family),
+                        genus = COALESCE(s.genus, w.genus),
+                        updated_at = NOW()
+                    FROM species u
+                    CROSS JOIN LATERAL (
+                        SELECT taxon_id, taxonomic_status, family, genus
+                        FROM wfo_backbone
+                        WHERE scientific_name % u.canonical_name
+                          AND taxon_rank = 'species'
+                        ORDER BY scientific_name <-> u.canonical_name
+                        LIMIT 1
+                    ) w
+                    WHERE u.id = s.id
+                      AND s.wfo_id IS NULL
+                      AND u.wfo_id IS NULL
+                """))
+                session.commit()
+                fuzzy_matches = result.rowcount
+                self.stats['wfo_fuzzy'] = fuzzy_matches
+                logger.info(f"  Fuzzy matches: {fuzzy_matches:,}")
+            except Exception as e:
+                session.rollback()
+                self.stats['errors'] += 1
+                logger.warning(f"  Fuzzy matching skipped (is pg_trgm installed?): {e}")
+
+        # Step 4: Count remaining unmatched and the total in one scan
+        with self.Session() as session:
+            unmatched, total = session.execute(text("""
+                SELECT COUNT(*) FILTER (WHERE wfo_id IS NULL), COUNT(*)
+                FROM species
+            """)).one()
+            self.stats['unmatched'] = unmatched
+            self.stats['total'] = total
 
         logger.info(f"Disambiguation complete: {self.stats}")
         return self.stats
@@ -736,7 +1131,16 @@ def run_disambiguation(db_url: str, batch_size: int = 10000, mode: str = 'sql'):
             logger.warning("rpy2 not available, falling back to subprocess mode")
         disambiguator = TaxonomicDisambiguator(db_url)
 
+    # Names the wfo_backbone table resolves exactly never reach R
+    preflight_matched = 0
+    if mode != 'sql':
+        try:
+            preflight_matched = TaxonomicDisambiguatorSQL(db_url).match_exact()
+        except Exception as e:
+            logger.info(f"Skipping wfo_backbone preflight: {e}")
+
     stats = disambiguator.run_full_disambiguation(batch_size=batch_size)
+    stats['wfo_matched'] += preflight_matched
     return stats
 
 
@@ -1,16 +1,85 @@
 """GBIF (Global Biodiversity Information Facility) crawler."""
-from typing import Generator, Dict, Any, List
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+from typing import Generator, Dict, Any, List, Optional
+import copy
+import hashlib
+import json
+import os
 import requests
+import tempfile
+import threading
 import time
 from .base import BaseCrawler
 
+# On-disk caches for family lists and, when requested, search pages
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'gbif_cache')
+
+# orjson is optional: it parses the large search pages several times faster
+# than the stdlib json behind response.json().
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# GBIF taxonomicStatus values (lowercased) -> internal status; anything
+# else is 'unresolved'
+_STATUS_MAP = {
+    'accepted': 'accepted',
+    'valid': 'accepted',
+    'synonym': 'synonym',
+    'heterotypic_synonym': 'synonym',
+    'homotypic_synonym': 'synonym',
+}
+# GBIF sends the enum names in upper case; listing those too lets transform
+# skip lowercasing for every record
+_STATUS_MAP.update({status.upper(): normalized for status, normalized in _STATUS_MAP.items()})
+
+# Vernacular language spellings (lowercased) -> ISO 639-1 code. Codes not
+# listed are cut to their first two letters.
+_LANGUAGE_MAP = {
+    'en': 'en',
+    'english': 'en',
+    'eng': 'en',
+    'pt': 'pt',
+    'portuguese': 'pt',
+    'por': 'pt',
+    'pt-br': 'pt',
+    'es': 'es',
+    'fr': 'fr',
+    'de': 'de',
+}
+
+# Languages whose vernacular names are kept
+_VERNACULAR_LANGUAGES = frozenset({'en', 'pt'})
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """
+    Decode a GBIF response body.
+
+    A body that is not JSON raises requests' JSONDecodeError either way, so
+    the RequestException handlers keep treating it as a failed request.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos, response=response) from e
+    return response.json()
+
 
 class GBIFCrawler(BaseCrawler):
     """
     Crawler for Global Biodiversity Information Facility.
 
     API Documentation: https://www.gbif.org/developer/species
-    Rate Limits: None specified, but use reasonable delays
+    Rate Limits: None specified, but use reasonable delays and a bounded
+    number of concurrent requests
     Coverage: ~2 million plant species names
 
     Note: GBIF API has a limit of 100,000 results per query.
@@ -32,6 +101,26 @@ class GBIFCrawler(BaseCrawler):
     MAX_OFFSET = 99700  # GBIF returns 404 after ~100k records
     REQUEST_DELAY = 0.1  # Delay between requests to be respectful
 
+    # Concurrent requests. Each in-flight request holds one keep-alive
+    # connection from the shared session's pool, so these must stay below
+    # its pool_maxsize (see create_http_session) for connections to be reused
+    # rather than opened and dropped.
+    FETCH_WORKERS = 8  # Search pages requested at once
+    FAMILY_WORKERS = 12  # Families crawled at once in by_family mode
+    FAMILIES_CACHE_TTL = 7 * 86400  # Seconds a cached family list stays valid
+    PAGE_CACHE_TTL = 86400  # Seconds a cached search page stays valid (cache_pages=True)
+    DETAILS_CACHE_SIZE = 10_000  # Species detail lookups kept per crawler
+
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
+        # Successful species detail lookups, per crawler and cleared by run()
+        self._details_cache = lru_cache(maxsize=self.DETAILS_CACHE_SIZE)(self._fetch_species_details)
+
+    def run(self, mode: str = 'incremental', **kwargs):
+        """Execute the crawler, refetching any species details looked up before."""
+        self._details_cache.cache_clear()
+        super().run(mode=mode, **kwargs)
+
     def fetch_data(self, mode='incremental', **kwargs) -> Generator[Dict[str, Any], None, None]:
         """
         Fetch plant species from GBIF.
@@ -41,20 +130,46 @@ class GBIFCrawler(BaseCrawler):
             **kwargs: Additional parameters
                 - taxon_key: Override the default taxon key (TRACHEOPHYTA)
                 - include_all_plants: If True, use PLANTAE_KEY instead
-                - by_family: If True, paginate by family to bypass 100k limit
+                - by_family: If True, paginate by family to bypass 100k limit.
+                  By default this is chosen automatically when the taxon has
+                  more records than offset paging can reach; pass False to
+                  page by offset regardless.
                 - families: List of specific family keys to fetch
+                - refresh_families: If True, refetch the family list instead
+                  of using the on-disk copy
+                - cache_pages: If True, keep search pages on disk and reuse
+                  them for PAGE_CACHE_TTL seconds (for development reruns)
+                - max_records: Stop after this many species
 
         Yields:
             Species data from GBIF
         """
+        max_records = kwargs.pop('max_records', None)
+
         # If by_family mode, delegate to family-based fetching
-        if kwargs.get('by_family', False):
-            yield from self._fetch_by_family(mode=mode, **kwargs)
-            return
+        by_family = kwargs.pop('by_family', None)
+        if by_family:
+            species = self._fetch_by_family(mode=mode, **kwargs)
+        else:
+            species = self._fetch_by_offset(mode, by_family, **kwargs)
 
+        # The producers never count records; closing them once max_records
+        # is reached cancels the pages and families still queued
+        try:
+            yield from islice(species, max_records)
+        finally:
+            species.close()
+
+    def _fetch_by_offset(self, mode: str, by_family: Optional[bool],
+                         **kwargs) -> Generator[Dict[str, Any], None, None]:
+        """
+        Fetch species with offset pagination over a single search.
+
+        Falls back to _fetch_by_family for taxa past MAX_OFFSET unless
+        by_family is False.
+        """
         limit = kwargs.get('limit', 300)
-        max_records = kwargs.get('max_records', None)
-        offset = 0
+        cache = kwargs.get('cache_pages', False)
         total_fetched = 0
 
         # Determine which taxon to query
@@ -67,91 +182,169 @@ class GBIFCrawler(BaseCrawler):
 
         self.logger.info(f"Starting GBIF fetch for {taxon_name} (limit={limit}, mode={mode})")
 
-        while True:
-            try:
-                # Search for accepted plant species
-                response = requests.get(
-                    f"{self.BASE_URL}/species/search",
-                    params={
-                        'highertaxonKey': taxon_key,
-                        'status': 'ACCEPTED',
-                        'rank': 'SPECIES',
-                        'limit': limit,
-                        'offset': offset,
-                    },
-                    timeout=60
+        # Search for accepted plant species
+        params = {
+            'highertaxonKey': taxon_key,
+            'status': 'ACCEPTED',
+            'rank': 'SPECIES',
+        }
+
+        try:
+            probe = self._search_page(params, 0, 0, cache)
+            count = probe.get('count', 0) if probe else 0
+
+            if count > self.MAX_OFFSET:
+                if by_family is None:
+                    # GBIF cannot filter species/search by key range, so the
+                    # taxon is split into families, each under the offset limit
+                    self.logger.info(
+                        f"{taxon_name} has {count} records, more than offset paging reaches; "
+                        f"fetching by family"
+                    )
+                    yield from self._fetch_by_family(mode=mode, **kwargs)
+                    return
+                self.logger.warning(
+                    f"Query matches {count} records but GBIF stops at offset {self.MAX_OFFSET}. "
+                    f"Use by_family=True for complete data."
                 )
 
-                # Handle 404 as end of pagination (GBIF API limitation)
-                if response.status_code == 404:
-                    self.logger.info(f"Reached GBIF pagination limit at offset {offset}")
-                    break
+            for results in self._iter_search_pages(params, limit, count, cache):
+                yield from results
+                total_fetched += len(results)
 
-                response.raise_for_status()
-                data = response.json()
+                # Log progress every 3000 records
+                if total_fetched % 3000 == 0:
+                    self.logger.info(f"Progress: {total_fetched} records fetched")
 
-                results = data.get('results', [])
-                if not results:
-                    self.logger.info(f"No more results at offset {offset}")
-                    break
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"GBIF API error: {e}")
+            raise
 
-                for species in results:
-                    yield species
-                    total_fetched += 1
+        self.logger.info(f"End of records reached. Total: {total_fetched}")
 
-                    if max_records and total_fetched >= max_records:
-                        self.logger.info(f"Reached max_records limit: {max_records}")
-                        return
+    def _search_page(self, params: Dict, offset: int, limit: int, cache: bool = False,
+                     endpoint: str = 'species/search') -> Optional[Dict]:
+        """
+        Fetch one page of a GBIF search.
 
-                # Check if there are more results
-                end_of_records = data.get('endOfRecords', True)
-                if end_of_records:
-                    self.logger.info(f"End of records reached. Total: {total_fetched}")
-                    break
+        Args:
+            params: Search filters
+            offset: Record offset of the page
+            limit: Page size
+            cache: Reuse and store the page in the on-disk page cache
+            endpoint: Search endpoint, relative to BASE_URL
 
-                offset += limit
+        Returns:
+            The response body, or None on 404 (GBIF's pagination limit)
+        """
+        if cache:
+            cache_path = self._page_cache_path(params, offset, limit, endpoint)
+            data = self._read_json_cache(cache_path, self.PAGE_CACHE_TTL)
+            if data is None:
+                data = self._search_page(params, offset, limit, endpoint=endpoint)
+                if data is not None:
+                    self._write_json_cache(cache_path, data)
+            return data
+
+        response = self.session.get(
+            f"{self.BASE_URL}/{endpoint}",
+            params={**params, 'limit': limit, 'offset': offset},
+            timeout=60
+        )
+        if response.status_code == 404:
+            self.logger.info(f"Reached GBIF pagination limit at offset {offset}")
+            return None
 
-                # Check if we're approaching the API limit
-                if offset >= self.MAX_OFFSET:
-                    self.logger.warning(
-                        f"Approaching GBIF API limit at offset {offset}. "
-                        f"Use by_family=True for complete data."
-                    )
-                    break
+        response.raise_for_status()
+        return _parse_json(response)
 
-                # Log progress every 3000 records
-                if total_fetched % 3000 == 0:
-                    self.logger.info(f"Progress: {total_fetched} records fetched")
+    def _iter_search_pages(self, params: Dict, limit: int, count: int, cache: bool = False,
+                           endpoint: str = 'species/search') -> Generator[List[Dict], None, None]:
+        """
+        Yield the result lists of a GBIF search, in offset order.
 
-                time.sleep(self.REQUEST_DELAY)
+        With the total count known, every page offset is known up front;
+        FETCH_WORKERS pages are requested at a time instead of waiting for
+        each page before asking for the next. Offsets stop short of
+        MAX_OFFSET, beyond which GBIF returns 404.
+        """
+        offsets = iter(range(0, min(count, self.MAX_OFFSET), limit))
 
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"GBIF API error: {e}")
-                # Don't raise on 404, treat as end of data
-                if '404' in str(e):
-                    self.logger.info(f"Stopping at offset {offset} due to API limit")
-                    break
-                raise
+        pool = ThreadPoolExecutor(max_workers=self.FETCH_WORKERS, thread_name_prefix=f"{self.name}-page")
+        try:
+            pages = deque(
+                pool.submit(self._search_page, params, offset, limit, cache, endpoint)
+                for offset in islice(offsets, self.FETCH_WORKERS)
+            )
+            while pages:
+                data = pages.popleft().result()
+                for offset in islice(offsets, 1):
+                    pages.append(pool.submit(self._search_page, params, offset, limit, cache, endpoint))
 
-    def _get_families(self, taxon_key: int) -> List[Dict]:
+                results = data.get('results', []) if data else []
+                if not results:
+                    return
+                yield results
+        finally:
+            # Pages still queued are not needed once the caller stops
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _families_cache_path(self, taxon_key: int) -> str:
+        """Path of the cached family list for a higher taxon."""
+        return os.path.join(CACHE_DIR, f'families_{taxon_key}.json')
+
+    def _page_cache_path(self, params: Dict, offset: int, limit: int, endpoint: str = 'species/search') -> str:
+        """Path of a cached search page, keyed by its query."""
+        query = json.dumps([endpoint, {**params, 'offset': offset, 'limit': limit}], sort_keys=True)
+        return os.path.join(CACHE_DIR, 'pages', hashlib.sha1(query.encode()).hexdigest() + '.json')
+
+    @staticmethod
+    def _read_json_cache(path: str, ttl: float) -> Optional[Any]:
+        """Load a cached JSON file, or None if it is missing or older than ttl seconds."""
+        if not os.path.exists(path) or time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json_cache(path: str, data: Any):
+        """Write a JSON cache file; the rename keeps concurrent readers off partial files."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def _get_families(self, taxon_key: int, force_refresh: bool = False) -> List[Dict]:
         """
         Get all families within a higher taxon.
 
+        The list changes rarely, so a complete fetch is kept on disk and
+        reused for FAMILIES_CACHE_TTL seconds.
+
         Args:
             taxon_key: The higher taxon key (e.g., TRACHEOPHYTA_KEY)
+            force_refresh: Ignore the cached list and fetch it again
 
         Returns:
             List of family records with 'key' and 'canonicalName'
         """
+        cache_path = self._families_cache_path(taxon_key)
+        families = None if force_refresh else self._read_json_cache(cache_path, self.FAMILIES_CACHE_TTL)
+        if families is not None:
+            self.logger.info(f"Loaded {len(families)} families for taxon {taxon_key} from cache")
+            return families
+
         families = []
         offset = 0
         limit = 1000
+        complete = False
 
         self.logger.info(f"Fetching families for taxon {taxon_key}...")
 
         while True:
             try:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.BASE_URL}/species/search",
                     params={
                         'highertaxonKey': taxon_key,
@@ -167,10 +360,11 @@ class GBIFCrawler(BaseCrawler):
                     break
 
                 response.raise_for_status()
-                data = response.json()
+                data = _parse_json(response)
 
                 results = data.get('results', [])
                 if not results:
+                    complete = True
                     break
 
                 for fam in results:
@@ -181,6 +375,7 @@ class GBIFCrawler(BaseCrawler):
                     })
 
                 if data.get('endOfRecords', True):
+                    complete = True
                     break
 
                 offset += limit
@@ -191,6 +386,11 @@ class GBIFCrawler(BaseCrawler):
                 break
 
         self.logger.info(f"Found {len(families)} families")
+
+        # Only cache a list that reached the end of the results
+        if complete:
+            self._write_json_cache(cache_path, families)
+
         return families
 
     def _fetch_by_family(self, mode='incremental', **kwargs) -> Generator[Dict[str, Any], None, None]:
@@ -206,7 +406,7 @@ class GBIFCrawler(BaseCrawler):
             Species data from GBIF
         """
         limit = kwargs.get('limit', 300)
-        max_records = kwargs.get('max_records', None)
+        cache = kwargs.get('cache_pages', False)
 
         # Determine taxon
         if kwargs.get('include_all_plants'):
@@ -219,82 +419,98 @@ class GBIFCrawler(BaseCrawler):
         self.logger.info(f"Starting GBIF fetch BY FAMILY for {taxon_name}")
 
         # Get all families
-        families = kwargs.get('families') or self._get_families(taxon_key)
+        families = kwargs.get('families') or self._get_families(
+            taxon_key, force_refresh=kwargs.get('refresh_families', False)
+        )
 
-        # Sort by number of descendants (largest first for better progress visibility)
+        # Largest first, so the long families start early instead of
+        # finishing last on a single worker
+        families = [f for f in families if f.get('key')]
         families.sort(key=lambda x: x.get('numDescendants', 0), reverse=True)
-
         total_fetched = 0
         families_processed = 0
 
-        for family in families:
-            family_key = family.get('key')
-            family_name = family.get('name', 'Unknown')
-
-            if not family_key:
-                continue
-
-            offset = 0
-            family_count = 0
-
-            self.logger.info(f"Fetching family {families_processed + 1}/{len(families)}: {family_name}")
-
-            while True:
-                try:
-                    response = requests.get(
-                        f"{self.BASE_URL}/species/search",
-                        params={
-                            'highertaxonKey': family_key,
-                            'status': 'ACCEPTED',
-                            'rank': 'SPECIES',
-                            'limit': limit,
-                            'offset': offset,
-                        },
-                        timeout=60
+        # Families paginate independently, so several are crawled at once and
+        # each one's species are yielded as soon as it completes. Only a few
+        # families beyond the worker count are queued, so fetching cannot run
+        # ahead of the consumer and hold the whole taxon in memory.
+        family_iter = iter(families)
+        pending = {}
+
+        def submit(n):
+            for family in islice(family_iter, n):
+                pending[pool.submit(self._fetch_one_family, family, limit, cache)] = family
+
+        pool = ThreadPoolExecutor(max_workers=self.FAMILY_WORKERS, thread_name_prefix=f"{self.name}-family")
+        try:
+            submit(2 * self.FAMILY_WORKERS)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                finished = [(pending.pop(future), future.result()) for future in done]
+                submit(len(finished))
+
+                for family, species_list in finished:
+                    families_processed += 1
+                    self.logger.info(
+                        f"Fetched family {families_processed}/{len(families)}: "
+                        f"{family.get('name', 'Unknown')} ({len(species_list)} species)"
                     )
 
-                    if response.status_code == 404:
-                        break
+                    yield from species_list
+                    total_fetched += len(species_list)
 
-                    response.raise_for_status()
-                    data = response.json()
+                    # Log progress every 10 families
+                    if families_processed % 10 == 0:
+                        self.logger.info(
+                            f"Progress: {families_processed}/{len(families)} families, "
+                            f"{total_fetched} total species"
+                        )
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
-                    results = data.get('results', [])
-                    if not results:
-                        break
+        self.logger.info(
+            f"Completed BY FAMILY fetch: {families_processed} families, "
+            f"{total_fetched} species"
+        )
 
-                    for species in results:
-                        yield species
-                        total_fetched += 1
-                        family_count += 1
+    def _fetch_one_family(self, family: Dict, limit: int, cache: bool = False) -> List[Dict]:
+        """
+        Fetch all accepted species of one family.
 
-                        if max_records and total_fetched >= max_records:
-                            self.logger.info(f"Reached max_records limit: {max_records}")
-                            return
+        Errors are logged and end the family early, keeping whatever pages
+        were already fetched, so one failing family does not stop the crawl.
+        """
+        params = {
+            'highertaxonKey': family['key'],
+            'status': 'ACCEPTED',
+            'rank': 'SPECIES',
+        }
+        family_species = []
+        offset = 0
 
-                    if data.get('endOfRecords', True):
-                        break
+        while True:
+            try:
+                data = self._search_page(params, offset, limit, cache)
+                if data is None:
+                    break
 
-                    offset += limit
-                    time.sleep(self.REQUEST_DELAY)
+                results = data.get('results', [])
+                if not results:
+                    break
 
-                except requests.exceptions.RequestException as e:
-                    self.logger.error(f"Error fetching family {family_name}: {e}")
+                family_species.extend(results)
+
+                if data.get('endOfRecords', True):
                     break
 
-            families_processed += 1
+                offset += limit
+                time.sleep(self.REQUEST_DELAY)
 
-            # Log progress every 10 families
-            if families_processed % 10 == 0:
-                self.logger.info(
-                    f"Progress: {families_processed}/{len(families)} families, "
-                    f"{total_fetched} total species"
-                )
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Error fetching family {family.get('name', 'Unknown')}: {e}")
+                break
 
-        self.logger.info(
-            f"Completed BY FAMILY fetch: {families_processed} families, "
-            f"{total_fetched} species"
-        )
+        return family_species
 
     def transform(self, raw_data: Dict) -> Dict:
         """
@@ -311,7 +527,9 @@ class GBIFCrawler(BaseCrawler):
             'genus': raw_data.get('genus'),
             'family': raw_data.get('family'),
             'gbif_taxon_key': raw_data.get('key') or raw_data.get('usageKey'),
-            'taxonomic_status': self._normalize_status(raw_data.get('taxonomicStatus', '')),
+            'taxonomic_status': _STATUS_MAP.get(raw_data.get('taxonomicStatus')) or self._normalize_status(
+                raw_data.get('taxonomicStatus', '')
+            ),
         }
 
         # Extract vernacular names if available
@@ -319,8 +537,11 @@ class GBIFCrawler(BaseCrawler):
         if vernacular:
             common_names = []
             for v in vernacular:
-                lang = self._normalize_language(v.get('language', 'en'))
-                if lang in ['en', 'pt']:
+                raw_lang = (v.get('language') or 'en').lower()
+                # Most languages are listed; unlisted ones go through the
+                # memoized normalizer
+                lang = _LANGUAGE_MAP.get(raw_lang) or self._normalize_language(raw_lang)
+                if lang in _VERNACULAR_LANGUAGES:
                     common_names.append({
                         'name': v.get('vernacularName'),
                         'language': lang
@@ -330,28 +551,20 @@ class GBIFCrawler(BaseCrawler):
 
         return transformed
 
-    def _normalize_status(self, status: str) -> str:
+    @staticmethod
+    def _normalize_status(status: str) -> str:
         """Normalize taxonomic status."""
-        status = status.lower() if status else ''
-        if status in ['accepted', 'valid']:
-            return 'accepted'
-        elif status in ['synonym', 'heterotypic_synonym', 'homotypic_synonym']:
-            return 'synonym'
-        else:
-            return 'unresolved'
+        return _STATUS_MAP.get(status.lower() if status else '', 'unresolved')
 
-    def _normalize_language(self, lang: str) -> str:
-        """Normalize language codes."""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_language(lang: str) -> str:
+        """Normalize language codes; each distinct spelling is worked out once."""
         lang = lang.lower() if lang else 'en'
-        # Map common variations
-        lang_map = {
-            'english': 'en',
-            'eng': 'en',
-            'portuguese': 'pt',
-            'por': 'pt',
-            'pt-br': 'pt',
-        }
-        return lang_map.get(lang, lang[:2] if len(lang) >= 2 else 'en')
+        code = _LANGUAGE_MAP.get(lang)
+        if code is None:
+            code = lang[:2] if len(lang) >= 2 else 'en'
+        return code
 
     def get_species_details(self, taxon_key: int) -> Dict:
         """
@@ -364,16 +577,38 @@ class GBIFCrawler(BaseCrawler):
             Detailed species information
         """
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/species/{taxon_key}",
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            # Copied so callers cannot change the cached record
+            return copy.deepcopy(self._details_cache(taxon_key))
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error fetching species {taxon_key}: {e}")
             return {}
 
+    def get_species_details_bulk(self, taxon_keys: List[int]) -> Dict[int, Dict]:
+        """
+        Get detailed information for many species.
+
+        GBIF has no multi-key species lookup, so the keys are fetched
+        FETCH_WORKERS at a time; failed lookups map to an empty dict.
+
+        Args:
+            taxon_keys: GBIF taxon keys
+
+        Returns:
+            Species information keyed by taxon key
+        """
+        keys = list(dict.fromkeys(taxon_keys))
+        with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS, thread_name_prefix=f"{self.name}-details") as pool:
+            return dict(zip(keys, pool.map(self.get_species_details, keys)))
+
+    def _fetch_species_details(self, taxon_key: int) -> Dict:
+        """Fetch one species record (uncached; see _details_cache)."""
+        response = self.session.get(
+            f"{self.BASE_URL}/species/{taxon_key}",
+            timeout=30
+        )
+        response.raise_for_status()
+        return _parse_json(response)
+
     def get_occurrences(self, taxon_key: int, country: str = None) -> Generator[Dict, None, None]:
         """
         Get occurrence records for a species.
@@ -385,39 +620,18 @@ class GBIFCrawler(BaseCrawler):
         Yields:
             Occurrence records
         """
-        offset = 0
         limit = 300
+        params = {'taxonKey': taxon_key}
+        if country:
+            params['country'] = country
 
-        while True:
-            params = {
-                'taxonKey': taxon_key,
-                'limit': limit,
-                'offset': offset,
-            }
-            if country:
-                params['country'] = country
-
-            try:
-                response = requests.get(
-                    f"{self.BASE_URL}/occurrence/search",
-                    params=params,
-                    timeout=60
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                results = data.get('results', [])
-                if not results:
-                    break
-
-                for occ in results:
-                    yield occ
-
-                if data.get('endOfRecords', True):
-                    break
-
-                offset += limit
+        # The total count fixes every page offset, so pages are fetched
+        # concurrently rather than each waiting on the previous endOfRecords
+        try:
+            probe = self._search_page(params, 0, 0, endpoint='occurrence/search')
+            count = probe.get('count', 0) if probe else 0
+            for results in self._iter_search_pages(params, limit, count, endpoint='occurrence/search'):
+                yield from results
 
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Error fetching occurrences: {e}")
-                break
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error fetching occurrences: {e}")
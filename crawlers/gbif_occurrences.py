@@ -17,7 +17,6 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Generator, Any, Optional
 from sqlalchemy import text
-from sqlalchemy.orm import Session
 
 from .base import BaseCrawler
 
@@ -53,6 +52,58 @@ class GBIFOccurrenceCrawler(BaseCrawler):
     MAX_RETRIES = 5  # Max retries on 429
     BACKOFF_BASE = 30  # Base backoff in seconds (30, 60, 120, 240, 480)
 
+    _OCCURRENCE_INSERT = text("""
+        INSERT INTO gbif_occurrences (
+            species_id, gbif_id, latitude, longitude,
+            coordinate_uncertainty_m, year, country_code,
+            bio1, bio5, bio6, bio7, bio12, bio15
+        ) VALUES (
+            :species_id, :gbif_id, :lat, :lon,
+            :uncertainty, :year, :country,
+            :bio1, :bio5, :bio6, :bio7, :bio12, :bio15
+        )
+        ON CONFLICT (gbif_id) DO NOTHING
+    """)
+
+    # Returns all bio variables at a point as JSONB
+    _CLIMATE_AT_POINT = text("SELECT get_climate_json_at_point(:lat, :lon) as climate_json")
+    _UPDATE_ANALYSIS = text("SELECT update_envelope_analysis(:species_id)")
+
+    _ENVELOPE_UPSERT = text("""
+        INSERT INTO climate_envelope_gbif (
+            species_id, temp_mean, temp_p05, temp_p95, temp_min, temp_max,
+            cold_month_mean, cold_month_p05, warm_month_mean, warm_month_p95,
+            precip_mean, precip_p05, precip_p95, precip_min, precip_max,
+            precip_seasonality, n_occurrences, n_countries, year_range, envelope_quality
+        ) VALUES (
+            :species_id, :temp_mean, :temp_p05, :temp_p95, :temp_min, :temp_max,
+            :cold_month_mean, :cold_month_p05, :warm_month_mean, :warm_month_p95,
+            :precip_mean, :precip_p05, :precip_p95, :precip_min, :precip_max,
+            :precip_seasonality, :n_occurrences, :n_countries, :year_range, :envelope_quality
+        )
+        ON CONFLICT (species_id) DO UPDATE SET
+            temp_mean = EXCLUDED.temp_mean,
+            temp_p05 = EXCLUDED.temp_p05,
+            temp_p95 = EXCLUDED.temp_p95,
+            temp_min = EXCLUDED.temp_min,
+            temp_max = EXCLUDED.temp_max,
+            cold_month_mean = EXCLUDED.cold_month_mean,
+            cold_month_p05 = EXCLUDED.cold_month_p05,
+            warm_month_mean = EXCLUDED.warm_month_mean,
+            warm_month_p95 = EXCLUDED.warm_month_p95,
+            precip_mean = EXCLUDED.precip_mean,
+            precip_p05 = EXCLUDED.precip_p05,
+            precip_p95 = EXCLUDED.precip_p95,
+            precip_min = EXCLUDED.precip_min,
+            precip_max = EXCLUDED.precip_max,
+            precip_seasonality = EXCLUDED.precip_seasonality,
+            n_occurrences = EXCLUDED.n_occurrences,
+            n_countries = EXCLUDED.n_countries,
+            year_range = EXCLUDED.year_range,
+            envelope_quality = EXCLUDED.envelope_quality,
+            updated_at = CURRENT_TIMESTAMP
+    """)
+
     def get_priority_species(self, limit: int = 1000) -> List[Dict]:
         """
         Get species that need GBIF occurrence-based envelopes.
@@ -61,7 +112,7 @@ class GBIFOccurrenceCrawler(BaseCrawler):
         1. Species with TreeGOER data (have ecoregion counts, likely findable in GBIF)
         2. Species with WCVP distribution but no envelope yet
         """
-        with Session(self.engine) as session:
+        with self.Session() as session:
             result = session.execute(text("""
                 SELECT
                     s.id,
@@ -104,7 +155,7 @@ class GBIFOccurrenceCrawler(BaseCrawler):
         """
         for attempt in range(self.MAX_RETRIES + 1):
             try:
-                response = requests.get(
+                response = self.session.get(
                     self.GBIF_API,
                     params=params,
                     timeout=30,
@@ -253,11 +304,11 @@ class GBIFOccurrenceCrawler(BaseCrawler):
         """
         climate_data = []
 
-        with Session(self.engine) as session:
+        with self.Session() as session:
             for occ in occurrences:
                 try:
                     result = session.execute(
-                        text("SELECT get_climate_json_at_point(:lat, :lon) as climate_json"),
+                        self._CLIMATE_AT_POINT,
                         {'lat': occ['latitude'], 'lon': occ['longitude']}
                     ).fetchone()
 
@@ -434,44 +485,50 @@ class GBIFOccurrenceCrawler(BaseCrawler):
         )
 
     def _save_occurrences(self, species_id: int, climate_data: List[Dict]) -> int:
-        """Save occurrence records to database."""
-        saved = 0
+        """
+        Save occurrence records to database.
 
-        with Session(self.engine) as session:
-            for d in climate_data:
-                try:
-                    session.execute(
-                        text("""
-                            INSERT INTO gbif_occurrences (
-                                species_id, gbif_id, latitude, longitude,
-                                coordinate_uncertainty_m, year, country_code,
-                                bio1, bio5, bio6, bio7, bio12, bio15
-                            ) VALUES (
-                                :species_id, :gbif_id, :lat, :lon,
-                                :uncertainty, :year, :country,
-                                :bio1, :bio5, :bio6, :bio7, :bio12, :bio15
-                            )
-                            ON CONFLICT (gbif_id) DO NOTHING
-                        """),
-                        {
-                            'species_id': species_id,
-                            'gbif_id': d['gbif_id'],
-                            'lat': d['latitude'],
-                            'lon': d['longitude'],
-                            'uncertainty': d.get('uncertainty_m'),
-                            'year': d.get('year'),
-                            'country': d.get('country_code'),
-                            'bio1': d.get('bio1'),
-                            'bio5': d.get('bio5'),
-                            'bio6': d.get('bio6'),
-                            'bio7': d.get('bio7'),
-                            'bio12': d.get('bio12'),
-                            'bio15': d.get('bio15')
-                        }
-                    )
-                    saved += 1
-                except Exception as e:
-                    self.logger.debug(f"Occurrence save error: {e}")
+        All records go in one executemany; if that fails they are retried
+        one savepoint each so a bad record does not drop the rest.
+        """
+        params = [
+            {
+                'species_id': species_id,
+                'gbif_id': d['gbif_id'],
+                'lat': d['latitude'],
+                'lon': d['longitude'],
+                'uncertainty': d.get('uncertainty_m'),
+                'year': d.get('year'),
+                'country': d.get('country_code'),
+                'bio1': d.get('bio1'),
+                'bio5': d.get('bio5'),
+                'bio6': d.get('bio6'),
+                'bio7': d.get('bio7'),
+                'bio12': d.get('bio12'),
+                'bio15': d.get('bio15')
+            }
+            for d in climate_data
+        ]
+        if not params:
+            return 0
+
+        saved = 0
+        with self.Session() as session:
+            try:
+                with session.begin_nested():
+                    session.execute(self._OCCURRENCE_INSERT, params)
+                saved = len(params)
+            except Exception as e:
+                self.logger.debug(f"Occurrence batch failed ({e}), retrying one by one")
+                for row in params:
+                    savepoint = session.begin_nested()
+                    try:
+                        session.execute(self._OCCURRENCE_INSERT, row)
+                        savepoint.commit()
+                        saved += 1
+                    except Exception as e:
+                        savepoint.rollback()
+                        self.logger.debug(f"Occurrence save error: {e}")
 
             session.commit()
 
@@ -479,42 +536,9 @@ class GBIFOccurrenceCrawler(BaseCrawler):
 
     def _save_envelope(self, species_id: int, envelope: Dict) -> None:
         """Save calculated envelope to database."""
-        with Session(self.engine) as session:
+        with self.Session() as session:
             session.execute(
-                text("""
-                    INSERT INTO climate_envelope_gbif (
-                        species_id, temp_mean, temp_p05, temp_p95, temp_min, temp_max,
-                        cold_month_mean, cold_month_p05, warm_month_mean, warm_month_p95,
-                        precip_mean, precip_p05, precip_p95, precip_min, precip_max,
-                        precip_seasonality, n_occurrences, n_countries, year_range, envelope_quality
-                    ) VALUES (
-                        :species_id, :temp_mean, :temp_p05, :temp_p95, :temp_min, :temp_max,
-                        :cold_month_mean, :cold_month_p05, :warm_month_mean, :warm_month_p95,
-                        :precip_mean, :precip_p05, :precip_p95, :precip_min, :precip_max,
-                        :precip_seasonality, :n_occurrences, :n_countries, :year_range, :envelope_quality
-                    )
-                    ON CONFLICT (species_id) DO UPDATE SET
-                        temp_mean = EXCLUDED.temp_mean,
-                        temp_p05 = EXCLUDED.temp_p05,
-                        temp_p95 = EXCLUDED.temp_p95,
-                        temp_min = EXCLUDED.temp_min,
-                        temp_max = EXCLUDED.temp_max,
-                        cold_month_mean = EXCLUDED.cold_month_mean,
-                        cold_month_p05 = EXCLUDED.cold_month_p05,
-                        warm_month_mean = EXCLUDED.warm_month_mean,
-                        warm_month_p95 = EXCLUDED.warm_month_p95,
-                        precip_mean = EXCLUDED.precip_mean,
-                        precip_p05 = EXCLUDED.precip_p05,
-                        precip_p95 = EXCLUDED.precip_p95,
-                        precip_min = EXCLUDED.precip_min,
-                        precip_max = EXCLUDED.precip_max,
-                        precip_seasonality = EXCLUDED.precip_seasonality,
-                        n_occurrences = EXCLUDED.n_occurrences,
-                        n_countries = EXCLUDED.n_countries,
-                        year_range = EXCLUDED.year_range,
-                        envelope_quality = EXCLUDED.envelope_quality,
-                        updated_at = CURRENT_TIMESTAMP
-                """),
+                self._ENVELOPE_UPSERT,
                 {
                     'species_id': species_id,
                     **envelope
@@ -524,10 +548,10 @@ class GBIFOccurrenceCrawler(BaseCrawler):
 
     def _update_analysis(self, species_id: int) -> None:
         """Update the analysis table for this species."""
-        with Session(self.engine) as session:
+        with self.Session() as session:
             try:
                 session.execute(
-                    text("SELECT update_envelope_analysis(:species_id)"),
+                    self._UPDATE_ANALYSIS,
                     {'species_id': species_id}
                 )
                 session.commit()
@@ -538,7 +562,7 @@ class GBIFOccurrenceCrawler(BaseCrawler):
         """Transform is not used - we handle everything in fetch_data."""
         return raw_data
 
-    def validate(self, data: Dict) -> bool:
+    def pre_validate(self, raw_data: Dict) -> bool:
         """Always returns False - processing is handled entirely in fetch_data."""
         return False
 
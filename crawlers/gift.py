@@ -46,8 +46,8 @@ class GIFTCrawler(BaseCrawler):
         'aquatic', 'epiphyte', 'other'
     }
 
-    def __init__(self, db_url: str):
-        super().__init__(db_url)
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
         self._r_available = self._check_r_available()
 
     def _check_r_available(self) -> bool:
@@ -542,6 +542,7 @@ class GIFTCrawler(BaseCrawler):
         Args:
             mode: 'full' or 'incremental'
         """
+        self._reset_stats()
         self._log_start()
 
         try:
@@ -574,6 +575,7 @@ class GIFTCrawler(BaseCrawler):
                 self._save(record)
                 self.stats['processed'] += 1
 
+            self._flush()
             self._log_success()
 
         except Exception as e:
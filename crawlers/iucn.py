@@ -39,10 +39,9 @@ class IUCNCrawler(BaseCrawler):
         'NE': 'Not Evaluated',
     }
 
-    def __init__(self, db_url: str):
-        super().__init__(db_url)
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
         self.api_token = os.environ.get('IUCN_API_TOKEN', '')
-        self.session = requests.Session()
 
     def _get_headers(self) -> Dict:
         """Get request headers with Bearer token (v4 API)."""
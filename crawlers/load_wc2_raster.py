@@ -32,6 +32,18 @@ DB_CONFIG = {
 }
 
 
+def tile_array_literal(data) -> str:
+    """
+    Format a tile as a PostgreSQL array literal.
+
+    Values are written with float32's shortest repr ("23.4"), not the
+    float64 expansion tolist() gives ("23.399999618530273"); the band is
+    32BF, so they round-trip exactly at about half the bytes.
+    """
+    values = data.astype(np.float32).astype(str)
+    return '{' + ','.join('{' + ','.join(row) + '}' for row in values) + '}'
+
+
 def load_raster(tif_path: Path, bio_var: str, conn) -> int:
     """Load a single raster file into PostGIS."""
 
@@ -90,10 +102,6 @@ def load_raster(tif_path: Path, bio_var: str, conn) -> int:
                 scale_x = tile_transform.a
                 scale_y = tile_transform.e
 
-                # Convert data to list of lists for PostgreSQL
-                # Replace nodata with NULL-friendly value
-                data_clean = np.where(valid_mask, data, None)
-
                 # Build the raster using ST_MakeEmptyRaster + ST_SetValues
                 # This is slower but works without raster2pgsql
                 try:
@@ -119,7 +127,7 @@ def load_raster(tif_path: Path, bio_var: str, conn) -> int:
                         upperleft_x, upperleft_y,
                         scale_x, scale_y,
                         float(nodata), float(nodata),
-                        data.tolist(),
+                        tile_array_literal(data),
                         float(nodata)
                     ))
                     loaded += 1
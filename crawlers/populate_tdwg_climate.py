@@ -20,6 +20,23 @@ DB_CONFIG = {
     'dbname': os.getenv('DB_NAME', os.getenv('POSTGRES_DB', 'diversiplant')),
 }
 
+# tdwg_climate columns written per region; min/max are only kept for bio1 and bio12
+CLIMATE_COLUMNS = (
+    'tdwg_code', 'resolution',
+    *(f'bio{i}_mean' for i in range(1, 20)),
+    'bio1_min', 'bio1_max', 'bio12_min', 'bio12_max',
+    'koppen_zone', 'whittaker_biome', 'aridity_index', 'pixel_count',
+)
+
+# Built once; values missing for a region are NULL and keep what is stored
+CLIMATE_UPSERT = f"""
+    INSERT INTO tdwg_climate ({', '.join(CLIMATE_COLUMNS)})
+    VALUES ({', '.join(f'%({col})s' for col in CLIMATE_COLUMNS)})
+    ON CONFLICT (tdwg_code) DO UPDATE SET
+    {', '.join(f'{col} = COALESCE(EXCLUDED.{col}, tdwg_climate.{col})' for col in CLIMATE_COLUMNS if col != 'tdwg_code')},
+    updated_at = CURRENT_TIMESTAMP
+"""
+
 
 def classify_koppen(mean_temp, annual_precip, max_temp, min_temp):
     """Simplified Köppen climate classification."""
@@ -182,19 +199,7 @@ def main():
                     climate_data['aridity_index'] = bio12 / (bio1 + 10) * 10
 
             # Insert/update into tdwg_climate
-            columns = list(climate_data.keys())
-            values = [climate_data[k] for k in columns]
-            placeholders = ', '.join(['%s'] * len(columns))
-            col_names = ', '.join(columns)
-            update_clause = ', '.join([f'{col} = EXCLUDED.{col}' for col in columns if col != 'tdwg_code'])
-
-            cursor.execute(f"""
-                INSERT INTO tdwg_climate ({col_names})
-                VALUES ({placeholders})
-                ON CONFLICT (tdwg_code) DO UPDATE SET
-                {update_clause},
-                updated_at = CURRENT_TIMESTAMP
-            """, values)
+            cursor.execute(CLIMATE_UPSERT, {col: climate_data.get(col) for col in CLIMATE_COLUMNS})
 
             processed += 1
 
@@ -13,7 +13,7 @@ import os
 import re
 from .base import BaseCrawler
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.engine import Connection
 
 
 class PractitionersCrawler(BaseCrawler):
@@ -63,8 +63,32 @@ class PractitionersCrawler(BaseCrawler):
         'grass': 'grass',
     }
 
-    def __init__(self, db_url: str):
-        super().__init__(db_url)
+    # Keeps downloaded source data on the instance
+    _SINGLETON_SAFE = False
+
+    # Existing species only get a missing family filled in;
+    # xmax = 0 means the row was inserted
+    _UPSERT_SPECIES = text("""
+        INSERT INTO species (canonical_name, family)
+        VALUES (:name, :family)
+        ON CONFLICT (canonical_name) DO UPDATE SET
+            family = COALESCE(species.family, EXCLUDED.family)
+        RETURNING id, (xmax = 0) as was_inserted
+    """)
+
+    TRAIT_COLUMNS = ('growth_form', 'max_height_m', 'stratum', 'threat_status',
+                     'establishment', 'habitat')
+
+    # NULLs never overwrite stored values (needs migration 013)
+    _TRAITS_UPSERT = text(f"""
+        INSERT INTO species_traits (species_id, source, {', '.join(TRAIT_COLUMNS)})
+        VALUES (:species_id, :source, {', '.join(f':{c}' for c in TRAIT_COLUMNS)})
+        ON CONFLICT (species_id, source) DO UPDATE SET
+            {', '.join(f"{c} = COALESCE(EXCLUDED.{c}, species_traits.{c})" for c in TRAIT_COLUMNS)}
+    """)
+
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
         self._df: Optional[pd.DataFrame] = None
 
     def fetch_data(self, mode='incremental', **kwargs) -> Generator[Dict[str, Any], None, None]:
@@ -264,94 +288,35 @@ class PractitionersCrawler(BaseCrawler):
 
         return gf_lower if gf_lower else None
 
-    def _save(self, data: Dict):
+    def _save_batch(self, conn: Connection, batch: list):
         """
-        Save practitioners data.
+        Save a batch of practitioners records.
 
-        For existing species: update traits
-        For new species: create species + traits
+        Species are upserted one by one (new ones are created, existing ones
+        only get a missing family); traits and common names for the whole
+        batch then go in one executemany each.
         """
-        canonical_name = data['canonical_name']
-
-        with Session(self.engine) as session:
-            # Check if species exists
-            result = session.execute(
-                text("SELECT id FROM species WHERE canonical_name = :name"),
-                {'name': canonical_name}
+        species_ids = []
+        for data in batch:
+            species_id, was_inserted = conn.execute(
+                self._UPSERT_SPECIES,
+                {'name': data['canonical_name'], 'family': data.get('family')}
             ).fetchone()
-
-            if result:
-                species_id = result[0]
-                self.stats['updated'] += 1
-            else:
-                # Insert new species
-                result = session.execute(
-                    text("""
-                        INSERT INTO species (canonical_name, family)
-                        VALUES (:name, :family)
-                        RETURNING id
-                    """),
-                    {'name': canonical_name, 'family': data.get('family')}
-                )
-                species_id = result.fetchone()[0]
-                self.stats['inserted'] += 1
-
-            # Save traits
-            if 'traits' in data:
-                self._save_traits_practitioners(session, species_id, data['traits'])
-
-            # Save common names
-            if 'common_names' in data:
-                self._save_common_names(session, species_id, data['common_names'])
-
-            session.commit()
-
-    def _save_traits_practitioners(self, session: Session, species_id: int, traits: Dict):
-        """Save practitioner-specific traits including threat_status."""
-        # Check if traits exist for this source
-        existing = session.execute(
-            text("SELECT id FROM species_traits WHERE species_id = :sid AND source = :src"),
-            {'sid': species_id, 'src': self.name}
-        ).fetchone()
-
-        if existing:
-            # Build update query
-            updates = []
-            values = {'id': existing[0]}
-
-            for key in ['growth_form', 'max_height_m', 'stratum', 'threat_status',
-                        'establishment', 'habitat']:
-                if traits.get(key) is not None:
-                    updates.append(f"{key} = :{key}")
-                    values[key] = traits[key]
-
-            if updates:
-                session.execute(
-                    text(f"UPDATE species_traits SET {', '.join(updates)} WHERE id = :id"),
-                    values
-                )
-        else:
-            # Insert new traits record
-            fields = ['species_id', 'source']
-            values = {'species_id': species_id, 'source': self.name}
-
-            for key in ['growth_form', 'max_height_m', 'stratum', 'threat_status',
-                        'establishment', 'habitat']:
-                if traits.get(key) is not None:
-                    fields.append(key)
-                    values[key] = traits[key]
-
-            cols_str = ', '.join(fields)
-            vals_str = ', '.join(f':{f}' for f in fields)
-
-            session.execute(
-                text(f"INSERT INTO species_traits ({cols_str}) VALUES ({vals_str})"),
-                values
-            )
+            self.stats['inserted' if was_inserted else 'updated'] += 1
+            species_ids.append(species_id)
+
+        self._save_traits_batch(conn, [
+            (species_id, data['traits'])
+            for species_id, data in zip(species_ids, batch) if 'traits' in data
+        ])
+        self._save_common_names_batch(conn, [
+            (species_id, data['common_names'])
+            for species_id, data in zip(species_ids, batch) if 'common_names' in data
+        ])
 
     def get_threat_stats(self) -> Dict:
         """Get statistics about threat status coverage."""
-        with Session(self.engine) as session:
+        with self.Session() as session:
             # Count by threat status
             result = session.execute(text("""
                 SELECT threat_status, COUNT(*) as count
@@ -371,7 +336,7 @@ class PractitionersCrawler(BaseCrawler):
 
     def get_establishment_stats(self) -> Dict:
         """Get statistics about establishment type coverage."""
-        with Session(self.engine) as session:
+        with self.Session() as session:
             result = session.execute(text("""
                 SELECT establishment, COUNT(*) as count
                 FROM species_traits
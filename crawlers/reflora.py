@@ -7,7 +7,6 @@ GBIF: https://doi.org/10.15468/1mtkaw
 Note: Old API (servicos.jbrj.gov.br) was discontinued. Now uses Darwin Core Archive.
 """
 from typing import Generator, Dict, Any, List, Optional
-import requests
 import zipfile
 import pandas as pd
 import json
@@ -30,12 +29,14 @@ class REFLORACrawler(BaseCrawler):
     # IPT Darwin Core Archive URL
     DWC_ARCHIVE_URL = 'https://ipt.jbrj.gov.br/jbrj/archive.do?r=lista_especies_flora_brasil'
 
-    def __init__(self, db_url: str):
-        super().__init__(db_url)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'DiversiPlant/1.0 (Academic Research)'
-        })
+    # Sent per request, since the HTTP session may be shared with other crawlers
+    HEADERS = {'User-Agent': 'DiversiPlant/1.0 (Academic Research)'}
+
+    # Keeps downloaded source data on the instance
+    _SINGLETON_SAFE = False
+
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
         self._cache_dir = os.path.join(tempfile.gettempdir(), 'reflora_dwc')
         self._taxon_df: Optional[pd.DataFrame] = None
         self._vernacular_df: Optional[pd.DataFrame] = None
@@ -131,7 +132,9 @@ class REFLORACrawler(BaseCrawler):
         # Download archive
         self.logger.info("Downloading Flora e Funga do Brasil Darwin Core Archive (~20MB)...")
         try:
-            response = self.session.get(self.DWC_ARCHIVE_URL, timeout=600, stream=True)
+            response = self.session.get(
+                self.DWC_ARCHIVE_URL, headers=self.HEADERS, timeout=600, stream=True
+            )
             response.raise_for_status()
 
             with open(archive_path, 'wb') as f:
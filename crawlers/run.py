@@ -8,12 +8,13 @@ Usage:
     python -m crawlers.run --list
 """
 import argparse
+import asyncio
 import os
 import sys
 import logging
 from datetime import datetime
 
-from . import get_crawler, list_crawlers
+from . import get_crawler, list_crawlers, run_all
 from .scheduler import get_scheduler
 
 # Configure logging
@@ -32,7 +33,7 @@ def parse_args():
 
     parser.add_argument(
         '--source', '-s',
-        choices=list_crawlers() + ['all'],
+        choices=[*list_crawlers(), 'all'],
         help='Crawler source to run (or "all" for all crawlers)'
     )
 
@@ -87,6 +88,13 @@ def parse_args():
         help='[GBIF] Paginate by family to get ALL species (bypasses 100k limit)'
     )
 
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=1,
+        help='With --source all, number of crawlers to run concurrently (default: 1)'
+    )
+
     parser.add_argument(
         '--refresh-unified',
         action='store_true',
@@ -153,16 +161,16 @@ def refresh_unified_tables(db_url: str):
         return False
 
 
-def run_all_crawlers(mode: str, db_url: str, **kwargs):
-    """Run all crawlers sequentially."""
-    results = {}
-    for source in list_crawlers():
-        success = run_crawler(source, mode, db_url, **kwargs)
-        results[source] = 'success' if success else 'failed'
+def run_all_crawlers(mode: str, db_url: str, parallel: int = 1, **kwargs):
+    """Run all crawlers, up to `parallel` at a time (sequentially by default)."""
+    results = asyncio.run(
+        run_all(list_crawlers(), db_url, mode=mode, max_batch=parallel,
+                runner=run_crawler, **kwargs)
+    )
 
     logger.info("All crawlers completed:")
-    for source, status in results.items():
-        logger.info(f"  {source}: {status}")
+    for source, success in results.items():
+        logger.info(f"  {source}: {'success' if success else 'failed'}")
 
 
 def start_scheduler(db_url: str):
@@ -232,7 +240,7 @@ def main():
             kwargs['by_family'] = True
 
         if args.source == 'all':
-            run_all_crawlers(args.mode, db_url, **kwargs)
+            run_all_crawlers(args.mode, db_url, parallel=args.parallel, **kwargs)
             # Refresh unified tables after all crawlers if requested
             if args.refresh_unified:
                 refresh_unified_tables(db_url)
@@ -7,7 +7,6 @@ Reference: Kindt (2024) DOI: 10.1111/geb.70064
 Zenodo: https://doi.org/10.5281/zenodo.13166796
 """
 from typing import Generator, Dict, Any, List, Optional
-import requests
 import pandas as pd
 import io
 import os
@@ -31,8 +30,11 @@ class TreeGOERCrawler(BaseCrawler):
     SPECIES_URL = 'https://zenodo.org/records/13166796/files/EcoregionsTreeFinder_species.txt?download=1'
     ECOREGIONS_URL = 'https://zenodo.org/records/13166796/files/EcoregionsTreeFinder_ecoregions.txt?download=1'
 
-    def __init__(self, db_url: str):
-        super().__init__(db_url)
+    # Keeps downloaded source data on the instance
+    _SINGLETON_SAFE = False
+
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
         self._cache_dir = os.path.join(tempfile.gettempdir(), 'ecoregions_treefinder')
         self._data: Optional[pd.DataFrame] = None
         self._species_data: Optional[pd.DataFrame] = None
@@ -102,7 +104,7 @@ class TreeGOERCrawler(BaseCrawler):
         # Download
         self.logger.info("Downloading EcoregionsTreeFinder data (49MB)...")
         try:
-            response = requests.get(self.DATA_URL, timeout=600, stream=True)
+            response = self.session.get(self.DATA_URL, timeout=600, stream=True)
             response.raise_for_status()
 
             # Save to cache
@@ -11,7 +11,7 @@ import pandas as pd
 import os
 from .base import BaseCrawler
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.engine import Connection
 
 
 class TRYCrawler(BaseCrawler):
@@ -28,8 +28,24 @@ class TRYCrawler(BaseCrawler):
     # Path to pre-processed TRY data
     DATA_FILE = 'data/TRY_lifespan_numeric_processed.txt'
 
-    def __init__(self, db_url: str):
-        super().__init__(db_url)
+    # Looks up species ids and upserts lifespans for a whole batch; names
+    # not in species are dropped by the join. xmax = 0 means the row was
+    # inserted (needs migration 013)
+    _UPSERT_LIFESPANS = text("""
+        INSERT INTO species_traits (species_id, source, lifespan_years)
+        SELECT s.id, :src, v.lifespan
+        FROM unnest(CAST(:names AS text[]), CAST(:lifespans AS numeric[])) AS v(name, lifespan)
+        JOIN species s ON s.canonical_name = v.name
+        ON CONFLICT (species_id, source) DO UPDATE SET
+            lifespan_years = EXCLUDED.lifespan_years
+        RETURNING (xmax = 0) as was_inserted
+    """)
+
+    # Keeps downloaded source data on the instance
+    _SINGLETON_SAFE = False
+
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
         self._df: Optional[pd.DataFrame] = None
 
     def fetch_data(self, mode='incremental', **kwargs) -> Generator[Dict[str, Any], None, None]:
@@ -96,35 +112,38 @@ class TRYCrawler(BaseCrawler):
 
             self.logger.info(f"Aggregated to {len(lifespan_df)} unique species")
 
-            count = 0
-            for _, row in lifespan_df.iterrows():
-                species_name = row['AccSpeciesName']
-                lifespan_years = row['StdValue']
+            # Skip invalid records
+            lifespan_df = lifespan_df.dropna(subset=['AccSpeciesName', 'StdValue'])
 
-                # Skip invalid records
-                if pd.isna(species_name) or pd.isna(lifespan_years):
-                    continue
+            # Skip unreasonably high values (likely errors)
+            # Note: Larrea tridentata has documented lifespan of 11,700 years
+            too_high = lifespan_df['StdValue'] > 15000
+            rejected = lifespan_df.loc[too_high, ['AccSpeciesName', 'StdValue']]
+            for species_name, lifespan_years in rejected.itertuples(index=False):
+                self.logger.warning(f"Skipping unrealistic lifespan: {species_name} = {lifespan_years} years")
 
-                # Skip unreasonably high values (likely errors)
-                # Note: Larrea tridentata has documented lifespan of 11,700 years
-                if lifespan_years > 15000:
-                    self.logger.warning(f"Skipping unrealistic lifespan: {species_name} = {lifespan_years} years")
-                    continue
+            # Reasonable range: 1-15000 years. Filtering here leaves only the
+            # canonical_name check to run per record, so validate is not
+            # overridden.
+            lifespan_df = lifespan_df[~too_high & (lifespan_df['StdValue'] >= 1)]
 
+            if max_records:
+                lifespan_df = lifespan_df.head(max_records)
+
+            # itertuples avoids building a Series per row like iterrows
+            columns = ['AccSpeciesName', 'StdValue', 'AccSpeciesID', 'DatasetID']
+            rows = lifespan_df[columns].itertuples(index=False)
+            for count, (species_name, lifespan_years, species_id, dataset_ids) in enumerate(rows, 1):
                 yield {
                     'AccSpeciesName': species_name,
                     'StdValue': float(lifespan_years),
-                    'AccSpeciesID': row.get('AccSpeciesID'),
-                    'DatasetIDs': row.get('DatasetID', [])
+                    'AccSpeciesID': species_id,
+                    'DatasetIDs': dataset_ids
                 }
 
-                count += 1
                 if count % 1000 == 0:
                     self.logger.info(f"Progress: {count} species processed")
 
-                if max_records and count >= max_records:
-                    break
-
         except Exception as e:
             self.logger.error(f"Error loading TRY data: {e}")
             raise
@@ -166,80 +185,35 @@ class TRYCrawler(BaseCrawler):
             return f"{parts[0]} {parts[1]}"
         return name.strip()
 
-    def validate(self, data: Dict) -> bool:
-        """Validate TRY data before saving."""
-        if not data.get('canonical_name'):
-            return False
-
-        traits = data.get('traits', {})
-        lifespan = traits.get('lifespan_years')
-
-        # Must have valid lifespan value
-        if lifespan is None:
-            return False
-
-        # Reasonable range: 1-15000 years (Larrea tridentata = 11,700 years)
-        if lifespan < 1 or lifespan > 15000:
-            return False
-
-        return True
-
-    def _save(self, data: Dict):
+    def _save_batch(self, conn: Connection, batch: list):
         """
         Save TRY data - only updates existing species.
 
         TRY is a trait-only source, so we don't create new species.
-        We only update lifespan_years for species that already exist.
+        We only update lifespan_years for species that already exist,
+        matching the whole batch by name in one statement.
         """
-        canonical_name = data['canonical_name']
-        lifespan_years = data['traits']['lifespan_years']
-
-        with Session(self.engine) as session:
-            # Find existing species
-            result = session.execute(
-                text("SELECT id FROM species WHERE canonical_name = :name"),
-                {'name': canonical_name}
-            ).fetchone()
-
-            if not result:
+        # ON CONFLICT cannot touch the same row twice, so the last value wins
+        lifespans = {}
+        for data in batch:
+            name = data['canonical_name']
+            if name in lifespans:
                 self.stats['skipped'] += 1
-                return
+            lifespans[name] = data['traits']['lifespan_years']
 
-            species_id = result[0]
-
-            # Check if traits exist for this source
-            existing = session.execute(
-                text("SELECT id FROM species_traits WHERE species_id = :sid AND source = :src"),
-                {'sid': species_id, 'src': self.name}
-            ).fetchone()
-
-            if existing:
-                # Update existing record
-                session.execute(
-                    text("""
-                        UPDATE species_traits
-                        SET lifespan_years = :lifespan
-                        WHERE id = :id
-                    """),
-                    {'id': existing[0], 'lifespan': lifespan_years}
-                )
-                self.stats['updated'] += 1
-            else:
-                # Insert new traits record
-                session.execute(
-                    text("""
-                        INSERT INTO species_traits (species_id, source, lifespan_years)
-                        VALUES (:sid, :src, :lifespan)
-                    """),
-                    {'sid': species_id, 'src': self.name, 'lifespan': lifespan_years}
-                )
-                self.stats['inserted'] += 1
-
-            session.commit()
+        result = conn.execute(self._UPSERT_LIFESPANS, {
+            'src': self.name,
+            'names': list(lifespans),
+            'lifespans': list(lifespans.values()),
+        }).fetchall()
+
+        for (was_inserted,) in result:
+            self.stats['inserted' if was_inserted else 'updated'] += 1
+        self.stats['skipped'] += len(lifespans) - len(result)
 
     def get_lifespan_stats(self) -> Dict:
         """Get statistics about lifespan data coverage."""
-        with Session(self.engine) as session:
+        with self.Session() as session:
             result = session.execute(text("""
                 SELECT
                     COUNT(*) as total,
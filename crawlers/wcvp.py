@@ -8,7 +8,6 @@ Supports two CSV formats:
 """
 from typing import Generator, Dict, Any, Optional
 import json
-import requests
 import zipfile
 import csv
 import io
@@ -16,7 +15,6 @@ import os
 import sys
 import tempfile
 from sqlalchemy import text
-from sqlalchemy.orm import Session
 from .base import BaseCrawler
 
 # Increase CSV field size limit for large WCVP fields
@@ -84,9 +82,22 @@ class WCVPCrawler(BaseCrawler):
     DOWNLOAD_URL = 'https://sftp.kew.org/pub/data-repositories/WCVP/'
     DISTRIBUTION_FILE = 'wcvp_distribution.csv'
 
-    def __init__(self, db_url: str):
-        super().__init__(db_url)
-        self.session = requests.Session()
+    # Keeps downloaded source data on the instance
+    _SINGLETON_SAFE = False
+
+    _DISTRIBUTION_UPSERT = text("""
+        INSERT INTO wcvp_distribution
+            (taxon_id, tdwg_code, establishment_means, endemic, introduced)
+        VALUES
+            (:taxon_id, :tdwg_code, :establishment_means, :endemic, :introduced)
+        ON CONFLICT (taxon_id, tdwg_code) DO UPDATE SET
+            establishment_means = EXCLUDED.establishment_means,
+            endemic = EXCLUDED.endemic,
+            introduced = EXCLUDED.introduced
+    """)
+
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
         self._data_dir: Optional[str] = None
         self._cols: Dict = {}  # Active column mapping
 
@@ -634,24 +645,29 @@ class WCVPCrawler(BaseCrawler):
         self.logger.info(f"Completed distribution: {dist_count} records saved, {skipped} skipped")
 
     def _save_distribution_batch(self, batch: list):
-        """Save a batch of distribution records."""
-        with Session(self.engine) as session:
+        """
+        Save a batch of distribution records in one executemany.
+
+        If the batch fails, records are retried one savepoint each so a bad
+        record does not drop the rest.
+        """
+        # Keep the last record per (taxon_id, tdwg_code), the row the old
+        # one-upsert-per-record loop would have left in place
+        batch = list({(r['taxon_id'], r['tdwg_code']): r for r in batch}.values())
+
+        with self.engine.begin() as conn:
+            try:
+                with conn.begin_nested():
+                    conn.execute(self._DISTRIBUTION_UPSERT, batch)
+                return
+            except Exception as e:
+                self.logger.debug(f"Distribution batch failed ({e}), retrying one by one")
+
             for record in batch:
+                savepoint = conn.begin_nested()
                 try:
-                    session.execute(
-                        text("""
-                            INSERT INTO wcvp_distribution
-                                (taxon_id, tdwg_code, establishment_means, endemic, introduced)
-                            VALUES
-                                (:taxon_id, :tdwg_code, :establishment_means, :endemic, :introduced)
-                            ON CONFLICT (taxon_id, tdwg_code) DO UPDATE SET
-                                establishment_means = EXCLUDED.establishment_means,
-                                endemic = EXCLUDED.endemic,
-                                introduced = EXCLUDED.introduced
-                        """),
-                        record
-                    )
+                    conn.execute(self._DISTRIBUTION_UPSERT, record)
+                    savepoint.commit()
                 except Exception as e:
+                    savepoint.rollback()
                     self.logger.debug(f"Error saving distribution: {e}")
-
-            session.commit()
@@ -1,6 +1,5 @@
 """WorldClim climate data crawler with full Bio variable storage."""
 from typing import Generator, Dict, Any, Optional, List, Tuple
-import requests
 import os
 import tempfile
 import zipfile
@@ -8,7 +7,6 @@ import io
 import json
 import numpy as np
 from sqlalchemy import text
-from sqlalchemy.orm import Session
 from .base import BaseCrawler
 
 
@@ -62,8 +60,11 @@ class WorldClimCrawler(BaseCrawler):
         'polar': {'temp_max': 10},
     }
 
-    def __init__(self, db_url: str):
-        super().__init__(db_url)
+    # Keeps downloaded source data on the instance
+    _SINGLETON_SAFE = False
+
+    def __init__(self, db_url: str, **kwargs):
+        super().__init__(db_url, **kwargs)
         self._cache_dir = os.path.join(tempfile.gettempdir(), 'worldclim_cache')
         os.makedirs(self._cache_dir, exist_ok=True)
         self._raster_data = {}
@@ -158,7 +159,7 @@ class WorldClimCrawler(BaseCrawler):
         self.logger.info(f"Downloading {url}")
 
         try:
-            response = requests.get(url, stream=True, timeout=1200)
+            response = self.session.get(url, stream=True, timeout=1200)
             response.raise_for_status()
 
             total_size = int(response.headers.get('content-length', 0))
@@ -188,7 +189,7 @@ class WorldClimCrawler(BaseCrawler):
             ORDER BY level3_code
         """)
 
-        with Session(self.engine) as session:
+        with self.Session() as session:
             result = session.execute(query)
             return result.fetchall()
 
@@ -490,7 +491,7 @@ class WorldClimCrawler(BaseCrawler):
             # Build params dict
             params = dict(zip(columns, values))
 
-            with Session(self.engine) as session:
+            with self.Session() as session:
                 session.execute(query, params)
                 session.commit()
             return True
@@ -581,7 +582,7 @@ class WorldClimCrawler(BaseCrawler):
             WHERE sd.species_id = :species_id AND sd.native = TRUE
         """)
 
-        with Session(self.engine) as session:
+        with self.Session() as session:
             result = session.execute(query, {'species_id': species_id})
             rows = result.fetchall()
 
@@ -657,7 +658,7 @@ class WorldClimCrawler(BaseCrawler):
             ORDER BY COUNT(*) DESC
         """)
 
-        with Session(self.engine) as session:
+        with self.Session() as session:
             row = session.execute(query).fetchone()
             biomes = session.execute(biome_query).fetchall()
 
@@ -0,0 +1,4 @@
+"""Starlette/Shiny wiring shared by the dashboard entry points."""
+from .factory import CachedStaticFiles, LazyApp, create_app
+
+__all__ = ['CachedStaticFiles', 'LazyApp', 'create_app']
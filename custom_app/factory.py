@@ -0,0 +1,149 @@
+"""Factory that wraps a Shiny app in the Starlette app served by uvicorn."""
+import importlib
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+import anyio
+import anyio.to_thread
+from shiny import App
+from starlette.applications import Starlette
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+
+from custom_server.session_store import install_session_middleware
+
+from .json_encoding import install_shiny_encoder
+
+logger = logging.getLogger(__name__)
+
+
+class LazyApp:
+    """ASGI app that builds the wrapped app on its first request."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._app = None
+
+    async def __call__(self, scope, receive, send):
+        if self._app is None:
+            self._app = self._factory()
+        await self._app(scope, receive, send)
+
+
+class RedirectApp:
+    """ASGI app answering with a permanent redirect browsers may cache."""
+
+    def __init__(self, url: str, max_age: int = 86400):
+        self.headers = [
+            (b"location", url.encode("latin-1")),
+            (b"cache-control", f"public, max-age={max_age}".encode("latin-1")),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": 308, "headers": self.headers})
+        await send({"type": "http.response.body", "body": b""})
+
+
+class HealthCheckMiddleware:
+    """Answers requests to path with 200 "ok" before any other middleware runs."""
+
+    def __init__(self, app, path: str = "/healthz"):
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == self.path:
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/plain"), (b"content-length", b"2")],
+            })
+            await send({"type": "http.response.body", "body": b"ok"})
+            return
+        await self.app(scope, receive, send)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets for max_age seconds."""
+
+    def __init__(self, *args, max_age: int = 86400, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = f"public, max-age={max_age}"
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("cache-control", self.cache_control)
+        return response
+
+
+def _import(module: str) -> None:
+    try:
+        importlib.import_module(module)
+    except Exception as e:
+        # Left for the session that needs it to fail on
+        logger.error(f"Preloading {module} failed: {e}")
+
+
+async def preload_modules(modules: Sequence[str]) -> None:
+    """Import modules concurrently in worker threads."""
+    async with anyio.create_task_group() as tg:
+        for module in modules:
+            tg.start_soon(anyio.to_thread.run_sync, _import, module)
+
+
+def create_app(
+    build_ui: Callable,
+    server: Callable,
+    mount: str = "/diversiplant",
+    static_dir: Optional[Path] = None,
+    static_max_age: int = 86400,
+    preload: Sequence[str] = (),
+) -> Starlette:
+    """
+    Build the Starlette app for a dashboard entry point.
+
+    Args:
+        build_ui: Callable returning the page UI (called on first request)
+        server: Shiny server function
+        mount: Path the Shiny app is mounted under; "/" redirects here
+        static_dir: Directory served as Shiny static assets, and also under
+            /static with Cache-Control headers
+        static_max_age: Browser cache lifetime for /static assets, in seconds
+        preload: Modules imported at startup so the first session does not
+            wait on them
+
+    Returns:
+        Starlette app with session middleware installed and a /healthz
+        endpoint that skips it
+    """
+    install_shiny_encoder()
+    # App renders a static page to HTML once, when it is built; later GETs
+    # reuse that string, so build_ui() must return tags, not a function
+    shiny_app = LazyApp(lambda: App(build_ui(), server, static_assets=static_dir))
+
+    routes = [
+        # Redirect root to the shiny app
+        Route("/", endpoint=RedirectApp(mount)),
+        Mount(mount, app=shiny_app)
+    ]
+    if static_dir is not None:
+        # Served outside Shiny so browsers can cache them
+        routes.insert(1, Mount(
+            "/static",
+            app=CachedStaticFiles(directory=static_dir, max_age=static_max_age),
+            name="static"
+        ))
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await preload_modules(preload)
+        yield
+
+    app = Starlette(routes=routes, lifespan=lifespan)
+    install_session_middleware(app)
+    # Added last so it wraps the session middleware
+    app.add_middleware(HealthCheckMiddleware)
+    return app
@@ -0,0 +1,124 @@
+"""Session middleware configuration for the Starlette wrapper app."""
+import hashlib
+import logging
+import os
+import struct
+import time
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from itsdangerous.exc import BadSignature
+from starlette.middleware.sessions import SessionMiddleware
+
+# starsessions is optional: without it (or without REDIS_URL) we fall back
+# to cookie sessions.
+try:
+    from starsessions import SessionAutoloadMiddleware
+    from starsessions import SessionMiddleware as StoreSessionMiddleware
+    from starsessions.stores.redis import RedisStore
+    HAS_STARSESSIONS = True
+except ImportError:
+    HAS_STARSESSIONS = False
+
+# cryptography is optional: without it cookies are signed, not encrypted.
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.environ.get("REDIS_URL", "")
+SESSION_LIFETIME = int(os.environ.get("SESSION_LIFETIME", "7200"))
+SESSION_COOKIE = "dp"
+SESSION_SECRET = os.environ.get("SESSION_SECRET", "")
+
+if not SESSION_SECRET:
+    logger.warning("SESSION_SECRET not set; cookie sessions won't survive restarts or span workers")
+    SESSION_SECRET = os.urandom(32).hex()
+
+# 256-bit key derived from the secret, whatever its length
+SESSION_KEY = hashlib.blake2b(
+    SESSION_SECRET.encode("utf-8"), digest_size=32, person=b"dp-session"
+).digest()
+
+if REDIS_URL and not HAS_STARSESSIONS:
+    logger.warning(
+        "REDIS_URL is set but starsessions/redis are not installed; "
+        "falling back to cookie sessions (pip install starsessions[redis])"
+    )
+
+# One store per process, shared by every app that installs the middleware
+store = RedisStore(url=REDIS_URL) if (HAS_STARSESSIONS and REDIS_URL) else None
+
+
+class AESGCMSigner:
+    """
+    Drop-in for the itsdangerous signer used by SessionMiddleware.
+
+    Tokens are base64(nonce | timestamp | ciphertext); the timestamp is
+    authenticated as associated data so max_age can't be bypassed.
+    """
+
+    NONCE_SIZE = 12
+
+    def __init__(self, key: bytes):
+        self.aead = AESGCM(key)
+
+    def sign(self, value: bytes) -> bytes:
+        nonce = os.urandom(self.NONCE_SIZE)
+        timestamp = struct.pack(">Q", int(time.time()))
+        return urlsafe_b64encode(nonce + timestamp + self.aead.encrypt(nonce, value, timestamp))
+
+    def unsign(self, value: bytes, max_age=None) -> bytes:
+        try:
+            raw = urlsafe_b64decode(value)
+            nonce, timestamp = raw[:self.NONCE_SIZE], raw[self.NONCE_SIZE:self.NONCE_SIZE + 8]
+            data = self.aead.decrypt(nonce, raw[self.NONCE_SIZE + 8:], timestamp)
+        except (ValueError, InvalidTag):
+            raise BadSignature("Invalid session cookie")
+        if max_age is not None and time.time() - struct.unpack(">Q", timestamp)[0] > max_age:
+            raise BadSignature("Session cookie expired")
+        return data
+
+
+class EncryptedSessionMiddleware(SessionMiddleware):
+    """SessionMiddleware whose cookies are AES-GCM encrypted instead of signed."""
+
+    def __init__(self, app, key: bytes, **kwargs):
+        super().__init__(app, secret_key="", **kwargs)
+        self.signer = AESGCMSigner(key)
+
+
+def install_session_middleware(app):
+    """
+    Attach session handling to a Starlette app.
+
+    Uses a Redis-backed server-side store when REDIS_URL is set, so all
+    workers share session state and the cookie only carries the session id.
+    Otherwise stores the session in a cookie keyed on SESSION_SECRET.
+    """
+    if store is not None:
+        # Autoload must sit inside SessionMiddleware, so it is added first
+        app.add_middleware(SessionAutoloadMiddleware)
+        app.add_middleware(
+            StoreSessionMiddleware,
+            store=store,
+            lifetime=SESSION_LIFETIME,
+            cookie_name=SESSION_COOKIE,
+        )
+    elif HAS_CRYPTOGRAPHY:
+        app.add_middleware(
+            EncryptedSessionMiddleware,
+            key=SESSION_KEY,
+            session_cookie=SESSION_COOKIE,
+            max_age=SESSION_LIFETIME,
+        )
+    else:
+        app.add_middleware(
+            SessionMiddleware,
+            secret_key=SESSION_SECRET,
+            session_cookie=SESSION_COOKIE,
+            max_age=SESSION_LIFETIME,
+        )
@@ -0,0 +1,10 @@
+"""Tab record shared by the custom_ui tab modules."""
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Tab:
+    """A dashboard tab: its nav panel and, optionally, its server function."""
+    nav_panel: Any
+    server: Optional[Callable] = None
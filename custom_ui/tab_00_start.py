@@ -3,6 +3,7 @@ from shiny import ui
 import faicons as fa
 from custom_ui.i18n import t, tab_title
 from custom_ui.nav_buttons import nav_buttons
+from custom_ui.tab import Tab
 
 start = ui.nav_panel(
     tab_title(0, "Início", "Start"),
@@ -117,3 +118,5 @@ start = ui.nav_panel(
     ),
     value="tab_start",
 )
+
+TAB = Tab(nav_panel=start)
@@ -6,6 +6,7 @@ from shinywidgets import output_widget
 import faicons as fa
 from custom_ui.i18n import t, tab_title
 from custom_ui.nav_buttons import nav_buttons
+from custom_ui.tab import Tab
 
 FILE_NAME = os.path.join(Path(__file__).parent.parent, "data", "MgmtTraitData_updated.csv")
 
@@ -126,3 +127,5 @@ location = ui.nav_panel(
     ),
     value="tab_location",
 )
+
+TAB = Tab(nav_panel=location)
@@ -6,6 +6,7 @@ from shinywidgets import output_widget
 from shiny import ui, render, reactive
 from custom_ui.i18n import t, tab_title
 from custom_ui.nav_buttons import nav_buttons
+from custom_ui.tab import Tab
 
 # Climate types mapping to Koppen classification
 CLIMATE_TYPES = {
@@ -129,3 +130,5 @@ climate = ui.nav_panel(
     ),
     value="tab_climate",
 )
+
+TAB = Tab(nav_panel=climate)
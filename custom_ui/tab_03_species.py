@@ -6,6 +6,7 @@ from shinywidgets import output_widget
 from custom_server.agroforestry_server import get_Plants
 from custom_ui.i18n import t, tab_title
 from custom_ui.nav_buttons import nav_buttons
+from custom_ui.tab import Tab
 
 FILE_NAME = os.path.join(
     Path(__file__).parent.parent, "data", "MgmtTraitData_updated.csv"
@@ -326,3 +327,5 @@ main_species = ui.nav_panel(
     ),
     value="tab_species",
 )
+
+TAB = Tab(nav_panel=main_species)
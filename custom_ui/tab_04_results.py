@@ -4,6 +4,7 @@ from shiny import ui, App
 from pathlib import Path
 from custom_ui.i18n import t, tab_title
 from custom_ui.nav_buttons import nav_buttons
+from custom_ui.tab import Tab
 
 FILE_NAME = os.path.join(Path(__file__).parent.parent, "data", "MgmtTraitData_updated.csv")
 
@@ -102,3 +103,5 @@ results = ui.nav_panel(
     ),
     value="tab_results",
 )
+
+TAB = Tab(nav_panel=results)
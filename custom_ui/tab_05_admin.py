@@ -1,6 +1,7 @@
 """Admin panel UI for DiversiPlant Dashboard."""
 from shiny import ui
 import faicons as fa
+from custom_ui.tab import Tab
 
 # Admin panel icons
 ADMIN_ICONS = {
@@ -380,3 +381,5 @@ admin = ui.nav_panel(
     ),
     value="tab_admin",
 )
+
+TAB = Tab(nav_panel=admin)
@@ -3,6 +3,7 @@ from shiny import ui
 import faicons as fa
 from custom_ui.i18n import t, tab_title
 from custom_ui.nav_buttons import nav_buttons
+from custom_ui.tab import Tab
 
 GROWTH_FORM_CHOICES = {
     "tree": t("Árvore", "Tree"),
@@ -170,3 +171,5 @@ recommend = ui.nav_panel(
     ),
     value="tab_recommend",
 )
+
+TAB = Tab(nav_panel=recommend)
@@ -0,0 +1,23 @@
+-- Migration: 013_species_traits_unique_source.sql
+-- Description: One species_traits row per (species_id, source), so crawlers
+--              can save traits with INSERT ... ON CONFLICT (species_id, source)
+-- Created: 2026-10-17
+
+BEGIN;
+
+-- =============================================
+-- 1. REMOVE DUPLICATES (keep the newest row)
+-- =============================================
+DELETE FROM species_traits t
+USING species_traits newer
+WHERE t.species_id = newer.species_id
+  AND t.source = newer.source
+  AND t.id < newer.id;
+
+-- =============================================
+-- 2. UNIQUE CONSTRAINT
+-- =============================================
+ALTER TABLE species_traits
+ADD CONSTRAINT species_traits_species_id_source_key UNIQUE (species_id, source);
+
+COMMIT;
@@ -0,0 +1,7 @@
+-- Migration: 014_drop_redundant_traits_index.sql
+-- Description: The UNIQUE (species_id, source) index from migration 013 also
+--              serves lookups by species_id, so idx_traits_species only adds
+--              write cost to every trait upsert
+-- Created: 2026-10-17
+
+DROP INDEX IF EXISTS idx_traits_species;
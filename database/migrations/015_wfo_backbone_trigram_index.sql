@@ -0,0 +1,16 @@
+-- Migration: 015_wfo_backbone_trigram_index.sql
+-- Description: Trigram index on wfo_backbone species names for the fuzzy
+--              step of TaxonomicDisambiguatorSQL (% and <-> operators)
+-- Created: 2026-10-17
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- wfo_backbone is created by the WFO import, so skip when it is missing
+DO $$
+BEGIN
+    IF to_regclass('wfo_backbone') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_wfo_backbone_name_trgm
+        ON wfo_backbone USING GIST (scientific_name gist_trgm_ops)
+        WHERE taxon_rank = 'species';
+    END IF;
+END $$;
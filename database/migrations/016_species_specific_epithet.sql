@@ -0,0 +1,36 @@
+-- Migration: 016_species_specific_epithet.sql
+-- Description: Stored specific_epithet on species so the genus + epithet step
+--              of TaxonomicDisambiguatorSQL is an indexed equi-join instead of
+--              a SPLIT_PART over every species row, plus matching indexes on
+--              wfo_backbone for both join steps
+-- Created: 2026-10-17
+
+BEGIN;
+
+-- =============================================
+-- 1. GENERATED COLUMN ON SPECIES
+-- =============================================
+ALTER TABLE species
+ADD COLUMN IF NOT EXISTS specific_epithet VARCHAR(255)
+    GENERATED ALWAYS AS (SPLIT_PART(canonical_name, ' ', 2)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_species_genus_epithet ON species(genus, specific_epithet);
+
+-- =============================================
+-- 2. WFO BACKBONE JOIN INDEXES
+-- =============================================
+-- wfo_backbone is created by the WFO import, so skip when it is missing
+DO $$
+BEGIN
+    IF to_regclass('wfo_backbone') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_wfo_backbone_name
+        ON wfo_backbone(scientific_name)
+        WHERE taxon_rank = 'species';
+
+        CREATE INDEX IF NOT EXISTS idx_wfo_backbone_genus_epithet
+        ON wfo_backbone(genus, specific_epithet)
+        WHERE taxon_rank = 'species';
+    END IF;
+END $$;
+
+COMMIT;
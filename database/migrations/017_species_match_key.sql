@@ -0,0 +1,52 @@
+-- Migration: 017_species_match_key.sql
+-- Description: Normalized match_key on species and wfo_backbone (lower case,
+--              no parenthesised authors, no var./subsp. part, letters only,
+--              single spaces) so name variants are matched by the exact
+--              step of TaxonomicDisambiguatorSQL instead of the fuzzy one
+-- Created: 2026-10-17
+
+BEGIN;
+
+-- =============================================
+-- 1. SPECIES
+-- =============================================
+ALTER TABLE species
+ADD COLUMN IF NOT EXISTS match_key VARCHAR(255) GENERATED ALWAYS AS (
+    BTRIM(REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(
+        LOWER(canonical_name),
+        '\s*\([^)]*\)', '', 'g'),
+        '\s+(var|subsp)\.?\s+.*$', ''),
+        '[^a-z\s]', '', 'g'),
+        '\s+', ' ', 'g'))
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_species_match_key ON species(match_key);
+
+-- =============================================
+-- 2. WFO BACKBONE
+-- =============================================
+-- wfo_backbone is created by the WFO import, so skip when it is missing.
+-- The species-rank match_key index replaces the scientific_name one from
+-- migration 016 for the exact step.
+DO $$
+BEGIN
+    IF to_regclass('wfo_backbone') IS NOT NULL THEN
+        ALTER TABLE wfo_backbone
+        ADD COLUMN IF NOT EXISTS match_key TEXT GENERATED ALWAYS AS (
+            BTRIM(REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(
+                LOWER(scientific_name),
+                '\s*\([^)]*\)', '', 'g'),
+                '\s+(var|subsp)\.?\s+.*$', ''),
+                '[^a-z\s]', '', 'g'),
+                '\s+', ' ', 'g'))
+        ) STORED;
+
+        CREATE INDEX IF NOT EXISTS idx_wfo_backbone_match_key
+        ON wfo_backbone(match_key)
+        WHERE taxon_rank = 'species';
+
+        DROP INDEX IF EXISTS idx_wfo_backbone_name;
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- Migration: 018_species_name_trigram_index.sql
+-- Description: Trigram index on the names of WCVP species for the fuzzy
+--              WCVP fallback of the disambiguators (% and <-> operators)
+-- Created: 2026-10-17
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_species_canonical_trgm
+ON species USING GIST (canonical_name gist_trgm_ops)
+WHERE wcvp_id IS NOT NULL;
@@ -20,6 +20,16 @@ CREATE TABLE species (
     iucn_taxon_id INTEGER,
     taxonomic_status VARCHAR(50), -- 'accepted', 'synonym', 'unresolved'
     accepted_name_id INTEGER REFERENCES species(id),
+    specific_epithet VARCHAR(255) GENERATED ALWAYS AS (SPLIT_PART(canonical_name, ' ', 2)) STORED,
+    -- Normalized name for exact matching (see migration 017)
+    match_key VARCHAR(255) GENERATED ALWAYS AS (
+        BTRIM(REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(
+            LOWER(canonical_name),
+            '\s*\([^)]*\)', '', 'g'),
+            '\s+(var|subsp)\.?\s+.*$', ''),
+            '[^a-z\s]', '', 'g'),
+            '\s+', ' ', 'g'))
+    ) STORED,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -27,6 +37,8 @@ CREATE TABLE species (
 CREATE INDEX idx_species_canonical ON species(canonical_name);
 CREATE INDEX idx_species_family ON species(family);
 CREATE INDEX idx_species_genus ON species(genus);
+CREATE INDEX idx_species_genus_epithet ON species(genus, specific_epithet);
+CREATE INDEX idx_species_match_key ON species(match_key);
 
 CREATE TABLE species_traits (
     id SERIAL PRIMARY KEY,
@@ -44,10 +56,11 @@ CREATE TABLE species_traits (
     -- Raw GIFT trait values for audit (Climber.R logic)
     _gift_trait_1_2_2 VARCHAR(100), -- Original growth form from GIFT
     _gift_trait_1_4_2 VARCHAR(100), -- Original climber type from GIFT
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(species_id, source)
 );
 
-CREATE INDEX idx_traits_species ON species_traits(species_id);
+-- Lookups by species_id use the UNIQUE(species_id, source) index
 CREATE INDEX idx_traits_growth_form ON species_traits(growth_form);
 
 CREATE TABLE common_names (